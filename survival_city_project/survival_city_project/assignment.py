@@ -0,0 +1,78 @@
+import heapq
+
+class AssignmentSolver:
+    def __init__(self, method="flow"):
+        if method not in ("flow", "greedy"):
+            raise ValueError(f"Unknown assignment method: {method}")
+        self.method = method
+
+    def solve(self, values, capacities):
+        if self.method == "greedy":
+            return self.solve_greedy(values, capacities)
+        return self.solve_flow(values, capacities)
+
+    def solve_greedy(self, values, capacities):
+        remaining = list(capacities)
+        roles = [None] * len(values)
+        pairs = sorted(((value, worker, role)
+                        for worker, row in enumerate(values)
+                        for role, value in enumerate(row) if value > 0 and remaining[role] > 0),
+                       reverse=True)
+        for value, worker, role in pairs:
+            if roles[worker] is None and remaining[role] > 0:
+                roles[worker] = role
+                remaining[role] -= 1
+        return roles
+
+    def solve_flow(self, values, capacities):
+        idle = len(capacities)
+        nodes = range(idle + 1)
+        capacities = list(capacities) + [len(values)]
+        loads = [0] * (idle + 1)
+        roles = [idle] * len(values)
+        gains = [[[] for _ in nodes] for _ in nodes]
+
+        def value(worker, role):
+            return values[worker][role] if role != idle else 0
+
+        def enter(worker, role):
+            roles[worker] = role
+            current = value(worker, role)
+            for other in nodes:
+                if other != role and capacities[other] > 0:
+                    heapq.heappush(gains[role][other], (current - value(worker, other), worker))
+
+        def best_move(source, target):
+            heap = gains[source][target]
+            while heap and roles[heap[0][1]] != source:
+                heapq.heappop(heap)
+            return (-heap[0][0], heap[0][1]) if heap else None
+
+        for worker in range(len(values)):
+            moves = [[best_move(source, target) if source != target else None for target in nodes]
+                     for source in nodes]
+            best = [value(worker, role) if capacities[role] > 0 else None for role in nodes]
+            previous = [None] * (idle + 1)
+            for _ in nodes:
+                changed = False
+                for source in nodes:
+                    if best[source] is None:
+                        continue
+                    for target in nodes:
+                        move = moves[source][target]
+                        if move is not None and best[source] + move[0] > best[target] + 1e-12:
+                            best[target] = best[source] + move[0]
+                            previous[target] = (source, move[1])
+                            changed = True
+                if not changed:
+                    break
+            end = max((role for role in nodes if best[role] is not None and loads[role] < capacities[role]),
+                      key=lambda role: best[role])
+            loads[end] += 1
+            role = end
+            while previous[role] is not None:
+                source, moved = previous[role]
+                enter(moved, role)
+                role = source
+            enter(worker, role)
+        return [role if role != idle else None for role in roles]
@@ -1,8 +1,25 @@
 import math
 import random
+from spatial import SpatialGrid
+
+def hit_chance(attacker_skill, weapon_accuracy, distance, is_night=False):
+    base_chance = weapon_accuracy * (1 + attacker_skill * 0.05)
+    distance_penalty = max(0.1, 1 - (distance / 20))
+    night_penalty = 0.7 if is_night else 1.0
+    return min(0.95, base_chance * distance_penalty * night_penalty)
+
+def hit_damage(base_damage, attacker_skill, variance, critical_hit=False):
+    skill_bonus = 1 + (attacker_skill * 0.1)
+    crit_multiplier = 1.5 if critical_hit else 1.0
+    return int(base_damage * variance * skill_bonus * crit_multiplier)
 
 class CombatSystem:
-    def __init__(self):
+    def __init__(self, rng=None, auto_resolve_threshold=2000):
+        self.rng = rng if rng is not None else random
+        self.auto_resolve_threshold = auto_resolve_threshold
+        self.auto_resolve_tables = {}
+        self.auto_resolve_bucket_size = 1
+        self.swing_dispersion = 3.5
         self.weapon_stats = {
             "fists": {"damage": 5, "range": 1, "accuracy": 0.8},
             "knife": {"damage": 15, "range": 1, "accuracy": 0.85},
@@ -12,16 +29,10 @@ class CombatSystem:
         }
 
     def calculate_hit_chance(self, attacker_skill, weapon_accuracy, distance, is_night=False):
-        base_chance = weapon_accuracy * (1 + attacker_skill * 0.05)
-        distance_penalty = max(0.1, 1 - (distance / 20))
-        night_penalty = 0.7 if is_night else 1.0
-        return min(0.95, base_chance * distance_penalty * night_penalty)
+        return hit_chance(attacker_skill, weapon_accuracy, distance, is_night)
 
     def calculate_damage(self, base_damage, attacker_skill, critical_hit=False):
-        variance = random.uniform(0.8, 1.2)
-        skill_bonus = 1 + (attacker_skill * 0.1)
-        crit_multiplier = 1.5 if critical_hit else 1.0
-        return int(base_damage * variance * skill_bonus * crit_multiplier)
+        return hit_damage(base_damage, attacker_skill, self.rng.uniform(0.8, 1.2), critical_hit)
 
     def resolve_attack(self, attacker, target, weapon, distance):
         weapon_stats = self.weapon_stats.get(weapon, {})
@@ -34,8 +45,8 @@ class CombatSystem:
             distance
         )
         
-        hit = random.random() <= hit_chance
-        critical = hit and random.random() <= 0.1
+        hit = self.rng.random() <= hit_chance
+        critical = hit and self.rng.random() <= 0.1
         damage = self.calculate_damage(
             weapon_stats["damage"],
             attacker.get("combat_skill", 1),
@@ -52,16 +63,218 @@ class CombatSystem:
             "distance": distance
         }
 
+    def resolve_volley(self, engagements, is_night=False):
+        draw = self.rng.random
+        uniform = self.rng.uniform
+        hits, damage, criticals = [], [], []
+        for attacker, target, weapon, distance in engagements:
+            weapon_stats = self.weapon_stats.get(weapon)
+            if not weapon_stats:
+                hits.append(False)
+                damage.append(0)
+                criticals.append(False)
+                continue
+            skill = attacker.get("combat_skill", 1)
+            hit = draw() <= hit_chance(skill, weapon_stats["accuracy"], distance, is_night)
+            critical = hit and draw() <= 0.1
+            dealt = hit_damage(weapon_stats["damage"], skill, uniform(0.8, 1.2), critical) if hit else 0
+            if hit:
+                target.health -= dealt
+            hits.append(hit)
+            damage.append(dealt)
+            criticals.append(critical)
+        return {"hit": hits, "damage": damage, "critical": criticals}
+
+    def damage_distribution(self, base_damage, attacker_skill):
+        distribution = {}
+        skill_bonus = 1 + (attacker_skill * 0.1)
+        for crit_chance, crit_multiplier in ((0.9, 1.0), (0.1, 1.5)):
+            scale = base_damage * skill_bonus * crit_multiplier
+            low, high = scale * 0.8, scale * 1.2
+            for damage in range(int(low), int(high) + 1):
+                overlap = min(high, damage + 1) - max(low, damage)
+                if overlap > 0:
+                    distribution[damage] = distribution.get(damage, 0) + crit_chance * overlap / (high - low)
+        return distribution
+
+    def build_auto_resolve_tables(self, skill_levels=range(1, 11), bucket_size=1):
+        self.auto_resolve_bucket_size = bucket_size
+        self.auto_resolve_tables = {}
+        for weapon, weapon_stats in self.weapon_stats.items():
+            for skill in skill_levels:
+                distribution = self.damage_distribution(weapon_stats["damage"], skill)
+                mean_damage = sum(damage * chance for damage, chance in distribution.items())
+                for bucket in range(int(weapon_stats["range"] // bucket_size) + 1):
+                    distance = min(weapon_stats["range"], (bucket + 0.5) * bucket_size)
+                    chance = self.calculate_hit_chance(skill, weapon_stats["accuracy"], distance)
+                    self.auto_resolve_tables[(weapon, skill, bucket)] = {
+                        "hit_chance": chance,
+                        "expected_damage": chance * mean_damage,
+                        "damage_distribution": distribution
+                    }
+        return self.auto_resolve_tables
+
+    def table_key(self, weapon, attacker_skill, distance):
+        skill = max(1, min(10, round(attacker_skill)))
+        return (weapon, skill, int(distance // self.auto_resolve_bucket_size))
+
+    def damage_taken(self, hit_rates, limit):
+        rate = sum(hit_rates.values())
+        taken = [0.0] * limit
+        taken[0] = 1.0
+        if rate <= 0:
+            return taken
+        single_hit = {}
+        for key, hits in hit_rates.items():
+            for damage, chance in self.auto_resolve_tables[key]["damage_distribution"].items():
+                if damage < limit:
+                    single_hit[damage] = single_hit.get(damage, 0) + hits / rate * chance
+        shape = self.swing_dispersion
+        odds = rate / (rate + shape)
+        weight = (1 - odds) ** shape
+        taken[0] = weight
+        total = [1.0] + [0.0] * (limit - 1)
+        hits = 0
+        while True:
+            hits += 1
+            weight *= (hits - 1 + shape) / hits * odds
+            dealt = [0.0] * limit
+            for damage, chance in single_hit.items():
+                for before in range(limit - damage):
+                    dealt[before + damage] += total[before] * chance
+            total = dealt
+            for damage, chance in enumerate(total):
+                taken[damage] += weight * chance
+            if not any(total) or (hits > rate and weight < 1e-12):
+                break
+        return taken
+
+    def sample_binomial(self, trials, probability):
+        if trials <= 50:
+            return sum(1 for _ in range(trials) if self.rng.random() < probability)
+        mean = trials * probability
+        deviation = math.sqrt(mean * (1 - probability))
+        return max(0, min(trials, round(self.rng.gauss(mean, deviation))))
+
+    def auto_resolve(self, attacker_groups, zombie_groups):
+        if not self.auto_resolve_tables:
+            self.build_auto_resolve_tables()
+        total_zombies = sum(zombie_groups.values())
+        outcome = {}
+        hit_rates = {key: swings / total_zombies * self.auto_resolve_tables[key]["hit_chance"]
+                     for key, swings in attacker_groups.items()}
+        expected_damage = sum(swings / total_zombies * self.auto_resolve_tables[key]["expected_damage"]
+                              for key, swings in attacker_groups.items())
+        healths = {group: max(1, math.ceil(group[1])) for group in zombie_groups}
+        taken = self.damage_taken(hit_rates, max(healths.values(), default=1))
+        for group, count in zombie_groups.items():
+            survival_chance = sum(taken[:healths[group]])
+            kill_chance = max(0.0, 1 - survival_chance)
+            leftover = sum(damage * chance for damage, chance in enumerate(taken[:healths[group]])) \
+                / survival_chance if survival_chance > 0 else 0.0
+            outcome[group] = {
+                "kill_probability": kill_chance,
+                "expected_kills": count * kill_chance,
+                "expected_damage": count * expected_damage,
+                "leftover_damage": leftover,
+                "kills": self.sample_binomial(count, kill_chance)
+            }
+        return outcome
+
+    def lattice_sites(self, distance, inclusive=True):
+        reach = int(distance)
+        return sum(1 for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)
+                   if (dx * dx + dy * dy <= distance * distance if inclusive
+                       else dx * dx + dy * dy < distance * distance))
+
+    def engagement_groups(self, survivors, zombie_count, arena_area=100 * 100, site_zombies=0):
+        density = (zombie_count - site_zombies) / arena_area
+        site_density = site_zombies / arena_area
+        bucket_size = self.auto_resolve_bucket_size
+        counts = {}
+        for survivor in survivors:
+            if survivor["weapon"] in self.weapon_stats:
+                skill = max(1, min(10, round(survivor.get("combat_skill", 1))))
+                on_site = all(float(coordinate).is_integer() for coordinate in survivor["position"])
+                key = (survivor["weapon"], skill, on_site)
+                counts[key] = counts.get(key, 0) + 1
+        attacker_groups = {}
+        for (weapon, skill, on_site), count in counts.items():
+            weapon_range = self.weapon_stats[weapon]["range"]
+            for bucket in range(int(weapon_range // bucket_size) + 1):
+                near = bucket * bucket_size
+                far = min(weapon_range, (bucket + 1) * bucket_size)
+                if far <= near:
+                    continue
+                exposure_near = density * math.pi * near ** 2
+                exposure_far = density * math.pi * far ** 2
+                if on_site and site_density:
+                    exposure_near += site_density * self.lattice_sites(near, inclusive=False)
+                    exposure_far += site_density * self.lattice_sites(far, inclusive=far == weapon_range)
+                else:
+                    exposure_near += site_density * math.pi * near ** 2
+                    exposure_far += site_density * math.pi * far ** 2
+                in_bucket = math.exp(-exposure_near) - math.exp(-exposure_far)
+                if in_bucket > 0:
+                    key = (weapon, skill, bucket)
+                    attacker_groups[key] = attacker_groups.get(key, 0) + count * in_bucket
+        return attacker_groups
+
+    def auto_resolve_combat(self, survivors, zombies):
+        if not self.auto_resolve_tables:
+            self.build_auto_resolve_tables()
+        zombie_groups = {}
+        for zombie in zombies:
+            zombie_groups.setdefault((zombie.zombie_type, zombie.health), []).append(zombie)
+        site_zombies = sum(1 for zombie in zombies
+                           if all(float(coordinate).is_integer() for coordinate in zombie.horde.locate(zombie)))
+        attacker_groups = self.engagement_groups(survivors, len(zombies), site_zombies=site_zombies)
+        results = [f"Auto-resolved {sum(attacker_groups.values()):.0f} expected attacks "
+                   f"against {len(zombies)} zombies"]
+        if not zombies or not attacker_groups:
+            return results
+        outcome = self.auto_resolve(attacker_groups, {g: len(z) for g, z in zombie_groups.items()})
+        killed = []
+        for group, group_outcome in outcome.items():
+            kills = group_outcome["kills"]
+            for zombie in zombie_groups[group][:kills]:
+                zombie.health = 0
+                killed.append(zombie)
+                results.append(f"{zombie.zombie_type} died!")
+            wounds = round(group_outcome["leftover_damage"])
+            if wounds:
+                for zombie in zombie_groups[group][kills:]:
+                    zombie.health -= wounds
+        self.remove_killed(killed)
+        return results
+
+    def remove_killed(self, zombies):
+        hordes = {}
+        for zombie in zombies:
+            hordes.setdefault(zombie.horde, []).append(zombie)
+        for horde, killed in hordes.items():
+            horde.remove_zombies(killed)
+
     def group_combat(self, survivors, zombies):
+        if (self.auto_resolve_threshold is not None and
+                len(survivors) + len(zombies) >= self.auto_resolve_threshold):
+            return self.auto_resolve_combat(survivors, zombies)
         results = []
+        killed = []
+        reach = max((self.weapon_stats.get(survivor["weapon"], {}).get("range", 1)
+                     for survivor in survivors), default=1)
+        zombie_grid = SpatialGrid(lambda zombie: zombie.horde.locate(zombie),
+                                  cell_size=max(1, reach),
+                                  rank=lambda zombie: zombie.serial)
+        for zombie in zombies:
+            zombie_grid.insert(zombie)
         for survivor in survivors:
-            if not zombies:
+            if not zombie_grid:
                 break
-            nearest_zombie = min(zombies, key=lambda z: math.dist(
-                survivor["position"], z.position))
-            distance = math.dist(survivor["position"], nearest_zombie.position)
+            weapon_range = self.weapon_stats.get(survivor["weapon"], {}).get("range", 1)
+            nearest_zombie, distance = zombie_grid.nearest(survivor["position"], weapon_range)
             
-            if distance <= self.weapon_stats.get(survivor["weapon"], {}).get("range", 1):
+            if nearest_zombie is not None:
                 attack_result = self.resolve_attack(
                     survivor, nearest_zombie, survivor["weapon"], distance)
                 results.append(
@@ -71,7 +284,9 @@ class CombatSystem:
                     f"Critical: {attack_result['critical']}"
                 )
                 if nearest_zombie.health <= 0:
-                    zombies.remove(nearest_zombie)
+                    zombie_grid.remove(nearest_zombie)
+                    killed.append(nearest_zombie)
                     results.append(f"{nearest_zombie.zombie_type} died!")
         
+        self.remove_killed(killed)
         return results
\ No newline at end of file
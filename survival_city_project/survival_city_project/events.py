@@ -1,7 +1,13 @@
+import heapq
 import random
+import time
+from collections import deque
 
 class EventProbabilityEngine:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.probability_table = None
+        self.compiled_inputs = None
         self.base_events = {
             "zombie_attack": {"base_prob": 0.3, "severity_range": (1, 5)},
             "survivor_joins": {"base_prob": 0.1, "severity_range": (1, 3)},
@@ -16,37 +22,108 @@ class EventProbabilityEngine:
             "resource_shortage": lambda x: 1 + (x / 20),
             "weather": {"clear": 0.8, "rain": 1.2, "storm": 1.5}
         }
+        self.shortage_events = {"zombie_attack", "equipment_failure", "disease_outbreak"}
+        self.probability_cache = {}
+        self.probability_cache_size = 4096
+
+    def probability_inputs(self):
+        return ([(event_type, event["base_prob"]) for event_type, event in self.base_events.items()],
+                [(name, modifier if callable(modifier) else dict(modifier))
+                 for name, modifier in self.condition_modifiers.items()],
+                set(self.shortage_events))
+
+    def probability_table_stale(self):
+        return self.probability_table is None or self.probability_inputs() != self.compiled_inputs
+
+    def compile_probability_table(self):
+        self.compiled_inputs = self.probability_inputs()
+        self.probability_table = [
+            (event_type, event["base_prob"], event_type in self.shortage_events)
+            for event_type, event in self.base_events.items()
+        ]
+        self.probability_cache = {}
+
+    def invalidate_probability_table(self):
+        self.probability_table = None
+
+    def probability_key(self, conditions):
+        return (conditions.get("day_number", 1), conditions.get("population", 1),
+                conditions.get("resource_shortage", 0), conditions.get("weather", "clear"))
+
+    def event_probabilities(self, conditions):
+        if self.probability_table_stale():
+            self.compile_probability_table()
+        key = self.probability_key(conditions)
+        probabilities = self.probability_cache.get(key)
+        if probabilities is None:
+            modifiers = self.condition_modifiers
+            day_mod = modifiers["day_number"](key[0])
+            population_mod = modifiers["population"](key[1])
+            shortage_mod = modifiers["resource_shortage"](key[2])
+            weather_mod = modifiers["weather"].get(key[3], 1)
+            probabilities = {}
+            for event_type, base_prob, shortage_sensitive in self.probability_table:
+                modified_prob = base_prob * day_mod * population_mod
+                if shortage_sensitive:
+                    modified_prob *= shortage_mod
+                modified_prob *= weather_mod
+                probabilities[event_type] = max(0, min(1, modified_prob))
+            if len(self.probability_cache) >= self.probability_cache_size:
+                self.probability_cache.clear()
+            self.probability_cache[key] = probabilities
+        return probabilities
+
+    def event_probabilities_bulk(self, conditions_list):
+        if self.probability_table_stale():
+            self.compile_probability_table()
+        keys = [self.probability_key(conditions) for conditions in conditions_list]
+        distinct = list(dict.fromkeys(keys))
+        modifiers = self.condition_modifiers
+        day_mods = {day: modifiers["day_number"](day) for day in {key[0] for key in distinct}}
+        population_mods = {population: modifiers["population"](population)
+                           for population in {key[1] for key in distinct}}
+        shortage_mods = {shortage: modifiers["resource_shortage"](shortage)
+                         for shortage in {key[2] for key in distinct}}
+        growth = [day_mods[key[0]] for key in distinct]
+        populations = [population_mods[key[1]] for key in distinct]
+        shortages = [shortage_mods[key[2]] for key in distinct]
+        weathers = [modifiers["weather"].get(key[3], 1) for key in distinct]
+        columns = []
+        for event_type, base_prob, shortage_sensitive in self.probability_table:
+            if shortage_sensitive:
+                column = [max(0, min(1, base_prob * day_mod * population_mod * shortage_mod * weather_mod))
+                          for day_mod, population_mod, shortage_mod, weather_mod
+                          in zip(growth, populations, shortages, weathers)]
+            else:
+                column = [max(0, min(1, base_prob * day_mod * population_mod * weather_mod))
+                          for day_mod, population_mod, weather_mod in zip(growth, populations, weathers)]
+            columns.append(column)
+        event_types = [event_type for event_type, _, _ in self.probability_table]
+        computed = {key: dict(zip(event_types, row)) for key, row in zip(distinct, zip(*columns))}
+        if not columns:
+            computed = {key: {} for key in distinct}
+        return [computed[key] for key in keys]
 
     def calculate_event_probability(self, event_type, conditions):
+        return self.event_probabilities(conditions).get(event_type, 0)
+
+    def generate_severity(self, event_type, conditions, rng=None):
         if event_type not in self.base_events:
             return 0
-        base_prob = self.base_events[event_type]["base_prob"]
-        modified_prob = base_prob
-        modified_prob *= self.condition_modifiers["day_number"](conditions.get("day_number", 1))
-        modified_prob *= self.condition_modifiers["population"](conditions.get("population", 1))
-        if event_type in ["zombie_attack", "equipment_failure", "disease_outbreak"]:
-            modified_prob *= self.condition_modifiers["resource_shortage"](
-                conditions.get("resource_shortage", 0))
-        current_weather = conditions.get("weather", "clear")
-        weather_mod = self.condition_modifiers["weather"].get(current_weather, 1)
-        modified_prob *= weather_mod
-        return max(0, min(1, modified_prob))
-
-    def generate_severity(self, event_type, conditions):
-        if event_type not in self.base_events:
-            return 0
+        rng = rng if rng is not None else self.rng
         min_sev, max_sev = self.base_events[event_type]["severity_range"]
-        base_severity = random.randint(min_sev, max_sev)
+        base_severity = rng.randint(min_sev, max_sev)
         day_mod = 1 + (conditions.get("day_number", 1) / 50)
         final_severity = min(max_sev * 2, base_severity * day_mod)
         return round(final_severity)
 
-    def check_event_triggers(self, game_state):
+    def check_event_triggers(self, game_state, rng=None, probabilities=None):
+        rng = rng if rng is not None else self.rng
+        probabilities = probabilities if probabilities is not None else self.event_probabilities(game_state)
         triggered_events = []
-        for event_type in self.base_events:
-            prob = self.calculate_event_probability(event_type, game_state)
-            if random.random() < prob:
-                severity = self.generate_severity(event_type, game_state)
+        for event_type, prob in probabilities.items():
+            if rng.random() < prob:
+                severity = self.generate_severity(event_type, game_state, rng)
                 triggered_events.append({
                     "type": event_type,
                     "severity": severity,
@@ -54,7 +131,14 @@ class EventProbabilityEngine:
                 })
         return triggered_events
 
-    def calculate_cascade_probability(self, initial_event, game_state):
+    def check_event_triggers_bulk(self, game_states, rngs=None):
+        rngs = rngs if rngs is not None else [self.rng] * len(game_states)
+        probabilities = self.event_probabilities_bulk(game_states)
+        return [self.check_event_triggers(game_state, rng, state_probabilities)
+                for game_state, rng, state_probabilities in zip(game_states, rngs, probabilities)]
+
+    def calculate_cascade_probability(self, initial_event, game_state, rng=None):
+        rng = rng if rng is not None else self.rng
         cascade_map = {
             "equipment_failure": [("zombie_attack", 0.4), ("survivor_joins", 0.1)],
             "disease_outbreak": [("resource_discovery", 0.2), ("survivor_joins", -0.3)],
@@ -65,8 +149,8 @@ class EventProbabilityEngine:
             for followup_type, prob_mod in cascade_map[initial_event["type"]]:
                 base_prob = self.base_events[followup_type]["base_prob"]
                 new_prob = max(0, min(1, base_prob + prob_mod))
-                if random.random() < new_prob:
-                    severity = self.generate_severity(followup_type, game_state)
+                if rng.random() < new_prob:
+                    severity = self.generate_severity(followup_type, game_state, rng)
                     cascades.append({
                         "type": followup_type,
                         "severity": severity,
@@ -75,27 +159,146 @@ class EventProbabilityEngine:
         return cascades
 
 
+class EventHistory:
+    def __init__(self, ngram_size=3, retention=1000):
+        self.ngram_size = ngram_size
+        self.events = deque(maxlen=retention)
+        self.total_events = 0
+        self.event_counts = {}
+        self.sequence_counts = {n: {} for n in range(2, ngram_size + 1)}
+        self.recent_types = deque(maxlen=max(0, ngram_size - 1))
+        self.last_day = None
+        self.gap_count = 0
+        self.gap_total = 0
+        self.gap_squares = 0
+        self.gap_min = None
+        self.gap_max = None
+
+    def __len__(self):
+        return self.total_events
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def append(self, event):
+        event_type = event["type"]
+        self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+        recent = list(self.recent_types) + [event_type]
+        for n, counts in self.sequence_counts.items():
+            if len(recent) >= n:
+                sequence = tuple(recent[-n:])
+                counts[sequence] = counts.get(sequence, 0) + 1
+        self.recent_types.append(event_type)
+        if self.last_day is not None:
+            gap = event["day"] - self.last_day
+            self.gap_count += 1
+            self.gap_total += gap
+            self.gap_squares += gap * gap
+            self.gap_min = gap if self.gap_min is None else min(self.gap_min, gap)
+            self.gap_max = gap if self.gap_max is None else max(self.gap_max, gap)
+        self.last_day = event["day"]
+        self.events.append(event)
+        self.total_events += 1
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def sequence_count(self, sequence):
+        return self.sequence_counts.get(len(sequence), {}).get(tuple(sequence), 0)
+
+    def most_common_sequences(self, length=2, limit=5):
+        return sorted(self.sequence_counts.get(length, {}).items(), key=lambda x: -x[1])[:limit]
+
+    def average_gap(self):
+        return self.gap_total / self.gap_count if self.gap_count else 0
+
+    def gap_statistics(self):
+        mean = self.average_gap()
+        variance = self.gap_squares / self.gap_count - mean ** 2 if self.gap_count else 0
+        return {"count": self.gap_count, "mean": mean, "variance": variance,
+                "min": self.gap_min, "max": self.gap_max}
+
+
+class EventScheduler:
+    def __init__(self):
+        self.queue = []
+        self.scheduled = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def schedule(self, event, day=None):
+        day = day if day is not None else event["day"]
+        heapq.heappush(self.queue, (day, self.scheduled, event))
+        self.scheduled += 1
+
+    def schedule_many(self, events, days=None):
+        days = days if days is not None else [event["day"] for event in events]
+        entries = [(day, self.scheduled + index, event)
+                   for index, (day, event) in enumerate(zip(days, events))]
+        self.scheduled += len(entries)
+        if len(entries) > len(self.queue):
+            self.queue.extend(entries)
+            heapq.heapify(self.queue)
+        else:
+            for entry in entries:
+                heapq.heappush(self.queue, entry)
+
+    def next_day(self):
+        return self.queue[0][0] if self.queue else None
+
+    def pop_due(self, day):
+        queue = self.queue
+        due = []
+        while queue and queue[0][0] <= day:
+            due.append(heapq.heappop(queue)[2])
+        return due
+
+    def pending(self):
+        return [(day, event) for day, _, event in sorted(self.queue)]
+
+    def clear(self):
+        self.queue = []
+
+
 class EventChainSystem:
-    def __init__(self, probability_engine):
+    def __init__(self, probability_engine, rng=None, ngram_size=3):
         self.probability_engine = probability_engine
+        self.rng = rng if rng is not None else probability_engine.rng
         self.active_event_chains = []
-        self.event_history = []
+        self.event_history = EventHistory(ngram_size)
+        self.scheduler = EventScheduler()
+
+    def record_events(self, events):
+        self.event_history.extend(events)
 
-    def create_event_chain(self, initial_event, max_length=3):
+    def create_event_chain(self, initial_event, max_length=3, rng=None):
+        rng = rng if rng is not None else self.rng
         chain = [initial_event]
         current_event = initial_event
         for _ in range(max_length - 1):
             cascades = self.probability_engine.calculate_cascade_probability(current_event, {
                 "day_number": current_event["day"],
                 "population": 10
-            })
+            }, rng)
             if not cascades:
                 break
-            next_event = random.choice(cascades)
+            next_event = rng.choice(cascades)
             chain.append(next_event)
             current_event = next_event
         return chain
 
+    def schedule_event_chain(self, initial_event, max_length=3, delay=1, rng=None):
+        followups = self.create_event_chain(initial_event, max_length, rng)[1:]
+        for step, event in enumerate(followups, 1):
+            event["day"] = initial_event["day"] + step * delay
+        self.scheduler.schedule_many(followups)
+        return followups
+
+    def pop_due_events(self, day):
+        return self.scheduler.pop_due(day)
+
     def calculate_combined_impact(self, events):
         impact = 0
         multipliers = {
@@ -121,26 +324,71 @@ class EventChainSystem:
             forecast.append({"day": day, "probabilities": daily_forecast})
         return forecast
 
-    def analyze_event_patterns(self):
+    def simulate_event_forecast(self, game_state, days=3, samples=1000, time_budget=None, rng=None):
+        rng = rng if rng is not None else random.Random()
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        horizon = game_state["day_number"] + days
+        daily_probabilities = [
+            (day, list(self.probability_engine.event_probabilities(
+                {**game_state, "day_number": day}).items()))
+            for day in range(game_state["day_number"], horizon)
+        ]
+        event_types = list(self.probability_engine.base_events)
+        counts = {event_type: 0 for event_type in event_types}
+        severities = {event_type: [] for event_type in event_types}
+        impacts = []
+        completed = 0
+        while completed < samples:
+            if deadline is not None and completed and time.perf_counter() > deadline:
+                break
+            future_events = []
+            for day, probabilities in daily_probabilities:
+                for event_type, prob in probabilities:
+                    if rng.random() < prob:
+                        event = {
+                            "type": event_type,
+                            "severity": self.probability_engine.generate_severity(
+                                event_type, {"day_number": day}, rng),
+                            "day": day
+                        }
+                        chain = self.create_event_chain(event, rng=rng)
+                        for step, followup in enumerate(chain[1:], 1):
+                            followup["day"] = day + step
+                        future_events.extend(followup for followup in chain if followup["day"] < horizon)
+            for event in future_events:
+                counts[event["type"]] = counts.get(event["type"], 0) + 1
+                severities.setdefault(event["type"], []).append(event["severity"])
+            impacts.append(self.calculate_combined_impact(future_events))
+            completed += 1
+        if not completed:
+            return {
+                "days": days,
+                "samples": 0,
+                "expected_counts": {event_type: 0.0 for event_type in counts},
+                "severity_quantiles": {},
+                "impact": {"mean": 0.0}
+            }
+        return {
+            "days": days,
+            "samples": completed,
+            "expected_counts": {event_type: count / completed for event_type, count in counts.items()},
+            "severity_quantiles": {
+                event_type: self.quantiles(values) for event_type, values in severities.items() if values
+            },
+            "impact": {"mean": sum(impacts) / completed, **self.quantiles(impacts)}
+        }
+
+    def quantiles(self, values, points=(0.1, 0.5, 0.9)):
+        ordered = sorted(values)
+        return {f"p{round(point * 100)}": ordered[min(len(ordered) - 1, int(point * len(ordered)))]
+                for point in points}
+
+    def analyze_event_patterns(self, sequence_length=2):
         if not self.event_history:
             return {}
-        event_counts = {}
-        for event in self.event_history:
-            event_counts[event["type"]] = event_counts.get(event["type"], 0) + 1
-        sequences = []
-        for i in range(len(self.event_history) - 1):
-            seq = (self.event_history[i]["type"], self.event_history[i+1]["type"])
-            sequences.append(seq)
-        seq_counts = {}
-        for seq in sequences:
-            seq_counts[seq] = seq_counts.get(seq, 0) + 1
-        days_between = []
-        event_days = [e["day"] for e in self.event_history]
-        for i in range(len(event_days) - 1):
-            days_between.append(event_days[i+1] - event_days[i])
-        avg_days_between = sum(days_between) / len(days_between) if days_between else 0
         return {
-            "event_counts": event_counts,
-            "common_sequences": sorted(seq_counts.items(), key=lambda x: -x[1])[:5],
-            "average_days_between_events": avg_days_between
-        }
\ No newline at end of file
+            "event_counts": dict(self.event_history.event_counts),
+            "common_sequences": self.event_history.most_common_sequences(sequence_length),
+            "average_days_between_events": self.event_history.average_gap(),
+            "gap_statistics": self.event_history.gap_statistics()
+        }
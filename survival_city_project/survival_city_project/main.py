@@ -1,39 +1,53 @@
-import random
 from buildings import BuildingManager
-from survivors import Survivor, PopulationManager
+from survivors import Survivor, PopulationManager, SKILLS
 from resources import EconomyManager
 from zombies import ZombieHorde
 from events import EventProbabilityEngine, EventChainSystem
 from combat import CombatSystem
+from siege import SiegeSystem
 from statistics import GameStatistics
 from save import SaveGameManager
+from rng import RandomStreams
 
 class SurvivalGame:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.day = 1
         self.weather = "clear"
+        self.random_streams = RandomStreams(seed)
+        self.rng = self.random_streams.stream("game")
         self.building_manager = BuildingManager()
-        self.population_manager = PopulationManager()
+        self.population_manager = PopulationManager(self.random_streams.stream("survivors"))
         self.economy_manager = EconomyManager()
-        self.zombie_horde = ZombieHorde()
-        self.event_engine = EventProbabilityEngine()
+        self.zombie_horde = ZombieHorde(self.random_streams.stream("zombies"))
+        self.event_engine = EventProbabilityEngine(self.random_streams.stream("events"))
         self.event_system = EventChainSystem(self.event_engine)
-        self.combat_system = CombatSystem()
+        self.combat_system = CombatSystem(self.random_streams.stream("combat"))
+        self.siege_system = SiegeSystem(self.building_manager)
         self.statistics = GameStatistics()
         self.save_manager = SaveGameManager()
+        self.event_handlers = {
+            "zombie_attack": self.handle_zombie_attack,
+            "survivor_joins": self.handle_survivor_joins,
+            "resource_discovery": self.handle_resource_discovery,
+            "disease_outbreak": self.handle_disease_outbreak
+        }
         
       
-        for i in range(5):
-            self.add_random_survivor()
+        self.add_random_survivors(5)
     
     def add_random_survivor(self):
+        return self.add_random_survivors(1)[0]
+
+    def add_random_survivors(self, count):
         names = ["Alex", "Jamie", "Taylor", "Casey", "Riley", "Morgan"]
-        survivor = Survivor(random.choice(names), random.randint(18, 60))
-        for skill in survivor.skills:
-            survivor.skills[skill] += random.uniform(-0.5, 0.5)
-            survivor.skills[skill] = max(1, min(10, survivor.skills[skill]))
-        self.population_manager.add_survivor(survivor)
-        return survivor
+        chosen_names, ages = [], []
+        skills = {skill: [] for skill in SKILLS}
+        for _ in range(count):
+            chosen_names.append(self.rng.choice(names))
+            ages.append(self.rng.randint(18, 60))
+            for skill in SKILLS:
+                skills[skill].append(max(1, min(10, 1 + self.rng.uniform(-0.5, 0.5))))
+        return self.population_manager.create_survivors(chosen_names, ages, skills)
     
     def process_day(self):
         if not self.population_manager.survivors:
@@ -63,19 +77,25 @@ class SurvivalGame:
             "weather": self.weather
         }
         
-        triggered_events = self.event_engine.check_event_triggers(game_state)
+        new_events = self.event_engine.check_event_triggers(game_state)
+        for event in new_events:
+            self.event_system.schedule_event_chain(event)
+        triggered_events = self.event_system.pop_due_events(self.day) + new_events
         for event in triggered_events:
             self.handle_event(event)
-        human_positions = [[random.randint(0, 100), random.randint(0, 100)] 
+        self.event_system.record_events(triggered_events)
+        human_positions = [[self.rng.randint(0, 100), self.rng.randint(0, 100)] 
                           for _ in self.population_manager.survivors]
-        self.zombie_horde.update_all(human_positions)
+        siege_targets = self.siege_system.siege_targets()
+        self.zombie_horde.update_all(human_positions, move=not siege_targets)
+        siege_results = self.siege_system.advance(self.zombie_horde, self.day, siege_targets)
         
 
         survivors_in_combat = [{
             "name": s.name,
             "combat_skill": s.skills["combat"],
-            "weapon": random.choice(["fists", "knife", "melee_weapon"]),
-            "position": [random.randint(0, 100), random.randint(0, 100)]
+            "weapon": self.rng.choice(["fists", "knife", "melee_weapon"]),
+            "position": [self.rng.randint(0, 100), self.rng.randint(0, 100)]
         } for s in self.population_manager.survivors if s.skills["combat"] > 3]
         
         combat_results = self.combat_system.group_combat(survivors_in_combat, self.zombie_horde.zombies)
@@ -88,31 +108,50 @@ class SurvivalGame:
         })
         
         self.day += 1
-        self.weather = random.choice(["clear", "rain", "storm"])
+        self.weather = self.rng.choice(["clear", "rain", "storm"])
         
         return {
             "day": self.day - 1,
             "events": triggered_events,
             "combat_results": combat_results,
+            "siege_results": siege_results,
             "economy": economy_report
         }
     
+    def register_event_handler(self, event_type, handler, base_prob=None, severity_range=(1, 3)):
+        self.event_handlers[event_type] = handler
+        if base_prob is not None:
+            self.event_engine.base_events[event_type] = {
+                "base_prob": base_prob, "severity_range": severity_range}
+            self.event_engine.invalidate_probability_table()
+
     def handle_event(self, event):
-        if event["type"] == "zombie_attack":
-            for _ in range(event["severity"]):
-                self.zombie_horde.spawn_zombie(random.choice(["shambler", "runner"]))
-        elif event["type"] == "survivor_joins":
-            for _ in range(event["severity"]):
-                self.add_random_survivor()
-        elif event["type"] == "resource_discovery":
-            resources = ["food", "water", "wood", "metal"]
-            for _ in range(event["severity"]):
-                resource = random.choice(resources)
-                self.economy_manager.resources[resource] += random.randint(10, 30)
-        elif event["type"] == "disease_outbreak":
-            for survivor in random.sample(self.population_manager.survivors, 
-                                       min(event["severity"], len(self.population_manager.survivors))):
-                survivor.health -= random.randint(10, 30)
+        handler = self.event_handlers.get(event["type"])
+        if handler is not None:
+            handler(event)
+
+    def handle_zombie_attack(self, event):
+        zombie_types = [self.rng.choice(["shambler", "runner"]) for _ in range(event["severity"])]
+        self.zombie_horde.spawn_zombies(zombie_types)
+
+    def handle_survivor_joins(self, event):
+        self.add_random_survivors(event["severity"])
+
+    def handle_resource_discovery(self, event):
+        resources = ["food", "water", "wood", "metal"]
+        found = {}
+        for _ in range(event["severity"]):
+            resource = self.rng.choice(resources)
+            found[resource] = found.get(resource, 0) + self.rng.randint(10, 30)
+        for resource, amount in found.items():
+            self.economy_manager.resources[resource] += amount
+
+    def handle_disease_outbreak(self, event):
+        survivors = self.population_manager.survivors
+        infected = self.rng.sample(survivors, min(event["severity"], len(survivors)))
+        damages = [self.rng.randint(10, 30) for _ in infected]
+        for survivor, damage in zip(infected, damages):
+            survivor.health -= damage
     
     def save_game(self, save_name=None):
         game_state = {
@@ -129,9 +168,10 @@ class SurvivalGame:
                 "name": s.name,
                 "age": s.age,
                 "health": s.health,
-                "skills": s.skills
+                "skills": s.skills.copy()
             } for s in self.population_manager.survivors],
-            "resources": self.economy_manager.resources
+            "resources": self.economy_manager.resources,
+            "scheduled_events": [event for _, event in self.event_system.scheduler.pending()]
         }
         return self.save_manager.save_game(game_state, save_name)
     
@@ -143,9 +183,10 @@ class SurvivalGame:
         self.day = 1
         self.weather = "clear"
         self.building_manager = BuildingManager()
-        self.population_manager = PopulationManager()
+        self.population_manager = PopulationManager(self.random_streams.stream("survivors"))
         self.economy_manager = EconomyManager()
-        self.zombie_horde = ZombieHorde()
+        self.zombie_horde = ZombieHorde(self.random_streams.stream("zombies"))
+        self.siege_system = SiegeSystem(self.building_manager)
         
         self.day = result.get("day", 1)
         self.weather = result.get("weather", "clear")
@@ -153,6 +194,8 @@ class SurvivalGame:
             "food": 100, "water": 100, "medicine": 20, 
             "materials": 50, "wood": 50, "metal": 30
         })
+        self.event_system.scheduler.clear()
+        self.event_system.scheduler.schedule_many(result.get("scheduled_events", []))
         
         for building_data in result.get("buildings", []):
             try:
@@ -251,6 +294,8 @@ def main():
             print(f"Day {day_report['day']} completed")
             for event in day_report["events"]:
                 print(f"Event: {event['type']} (severity: {event['severity']})")
+            for result in day_report["siege_results"]:
+                print(result)
             for result in day_report["combat_results"]:
                 print(result)
         
@@ -1,3 +1,7 @@
+import random
+from array import array
+from assignment import AssignmentSolver
+
 class ResourceProduction:
     def __init__(self):
         self.production_rates = {
@@ -5,6 +9,11 @@ class ResourceProduction:
             "water_collector": {"base": 15, "per_worker": 3, "skill_multiplier": 1.5},
             "scavenging": {"base": 0, "per_worker": 8, "skill_multiplier": 3}
         }
+        self.output_resources = {
+            "farm": "food",
+            "water_collector": "water",
+            "scavenging": "materials"
+        }
         self.consumption_rates = {
             "food": {"per_survivor": 2, "stress_multiplier": 1.5},
             "water": {"per_survivor": 1.5, "stress_multiplier": 1.2},
@@ -61,8 +70,175 @@ class ResourceProduction:
                 shortage[resource] = f"Shortage in {days_until_empty:.1f} days"
         return shortage
 
+    def allocation_production(self, allocation, weather):
+        production = {}
+        for building_type, worker_count, avg_skill, avg_morale in allocation:
+            resource = self.output_resources.get(building_type)
+            if resource is None:
+                continue
+            efficiency = self.calculate_efficiency(avg_morale, 0, weather)
+            amount = self.calculate_production(building_type, worker_count, avg_skill) * efficiency
+            production[resource] = production.get(resource, 0) + amount
+        return production
+
+    def project_shortages(self, current_resources, scenarios, days=30):
+        production_table = {}
+        consumption_table = {}
+        count = len(scenarios)
+        resources = [r for r in ("food", "water", "materials", "medicine") if r in current_resources]
+        stocks = {r: [current_resources[r]] * count for r in resources}
+        depletion = {r: [None] * count for r in resources}
+        populations = [scenario["population"] for scenario in scenarios]
+        for day in range(days):
+            productions = []
+            consumptions = []
+            for index, scenario in enumerate(scenarios):
+                weather = scenario["weather"][day % len(scenario["weather"])]
+                key = (scenario["allocation"], weather)
+                if key not in production_table:
+                    production_table[key] = self.allocation_production(*key)
+                productions.append(production_table[key])
+                population = int(populations[index] * (1 + scenario.get("growth", 0)) ** day)
+                key = (population, int(population * scenario.get("sick_fraction", 0)),
+                       scenario.get("stress_level", 0))
+                if key not in consumption_table:
+                    consumption_table[key] = self.calculate_consumption(range(key[0]), key[1], key[2])
+                consumptions.append(consumption_table[key])
+            for resource in resources:
+                stocks[resource] = [
+                    max(0, max(0, stock + production.get(resource, 0)) - consumption.get(resource, 0))
+                    for stock, production, consumption in zip(stocks[resource], productions, consumptions)]
+                depleted = depletion[resource]
+                for index, stock in enumerate(stocks[resource]):
+                    if stock <= 0 and depleted[index] is None and consumptions[index].get(resource, 0) > 0:
+                        depleted[index] = day + 1
+        projection = {}
+        for resource in resources:
+            depletion_days = depletion[resource]
+            ordered = sorted(day if day is not None else days + 1 for day in depletion_days)
+            quantiles = {}
+            for point in (0.1, 0.5, 0.9):
+                value = ordered[int(point * (count - 1))] if ordered else days + 1
+                quantiles[f"p{int(point * 100)}"] = value if value <= days else None
+            projection[resource] = {
+                "depletion_days": depletion_days,
+                "probability": sum(1 for day in depletion_days if day is not None) / max(1, count),
+                "quantiles": quantiles,
+                "final_stock": sum(stocks[resource]) / max(1, count)
+            }
+        return projection
+
+class ProductionBuilding:
+    def __init__(self, building_type, workers=()):
+        self.type = building_type
+        self.skill = "farming" if building_type == "farm" else "scouting"
+        self.workers = {}
+        self.worker_count = 0
+        self.morale_sum = 0
+        self.skill_sum = 0
+        for worker in workers:
+            self.add_worker(worker)
+
+    @property
+    def avg_morale(self):
+        return self.morale_sum / max(1, self.worker_count)
+
+    @property
+    def avg_skill(self):
+        return self.skill_sum / max(1, self.worker_count)
+
+    def add_worker(self, worker):
+        if worker in self.workers:
+            return
+        self.workers[worker] = None
+        worker.add_workplace(self)
+        self.worker_count += 1
+        self.morale_sum += worker.morale
+        self.skill_sum += worker.skills.get(self.skill, 1)
+
+    def remove_worker(self, worker):
+        if worker not in self.workers:
+            return
+        del self.workers[worker]
+        worker.remove_workplace(self)
+        self.worker_count -= 1
+        self.morale_sum -= worker.morale
+        self.skill_sum -= worker.skills.get(self.skill, 1)
+
+    def morale_changed(self, old_morale, new_morale):
+        self.morale_sum += new_morale - old_morale
+
+    def skill_changed(self, skill, old_level, new_level):
+        if skill == self.skill:
+            self.skill_sum += new_level - old_level
+
+class EconomyHistory:
+    def __init__(self, retention=365):
+        self.retention = retention
+        self.size = retention + 1
+        self.days = 0
+        self.columns = {}
+
+    def __len__(self):
+        return min(self.days, self.retention)
+
+    def __bool__(self):
+        return self.days > 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("economy history index out of range")
+        day = self.days - len(self) + index + 1
+        record = {"day": day, "production": {}, "consumption": {}, "resources": {}}
+        for (series, resource), column in self.columns.items():
+            if series == "resources":
+                record[series][resource] = column[day % self.size]
+            else:
+                record[series][resource] = column[day % self.size] - column[(day - 1) % self.size]
+        return record
+
+    def column(self, series, resource):
+        key = (series, resource)
+        if key not in self.columns:
+            self.columns[key] = array("d", bytes(8 * self.size))
+        return self.columns[key]
+
+    def append(self, production, consumption, resources):
+        self.days += 1
+        index = self.days % self.size
+        previous = (self.days - 1) % self.size
+        for series, values in (("production", production), ("consumption", consumption)):
+            for resource in values:
+                self.column(series, resource)
+            for (column_series, resource), column in self.columns.items():
+                if column_series == series:
+                    column[index] = column[previous] + values.get(resource, 0)
+        for resource, amount in resources.items():
+            self.column("resources", resource)[index] = amount
+
+    def total(self, series, resource, days):
+        column = self.columns.get((series, resource))
+        if column is None:
+            return 0
+        days = min(days, len(self))
+        return column[self.days % self.size] - column[(self.days - days) % self.size]
+
+    def average(self, series, resource, days):
+        return self.total(series, resource, days) / days
+
+    def stock(self, resource, days_ago=0):
+        column = self.columns.get(("resources", resource))
+        if column is None:
+            return 0
+        return column[(self.days - days_ago) % self.size]
+
+    def trend(self, resource, days):
+        return self.stock(resource) - self.stock(resource, min(days, len(self) - 1))
+
 class EconomyManager:
-    def __init__(self):
+    def __init__(self, history_retention=365):
         self.resources = {
             "food": 100, 
             "water": 100, 
@@ -72,17 +248,12 @@ class EconomyManager:
             "metal": 30
         }
         self.production_buildings = []
-        self.daily_history = []
+        self.daily_history = EconomyHistory(history_retention)
         self.production_system = ResourceProduction()
 
     def add_production_building(self, building_type, workers=[]):
-        building_info = {
-            "type": building_type,
-            "workers": workers,
-            "avg_skill": sum(w.skills.get("farming" if building_type == "farm" else "scouting", 1) 
-                            for w in workers) / max(1, len(workers))
-        }
-        self.production_buildings.append(building_info)
+        building = ProductionBuilding(building_type, workers)
+        self.production_buildings.append(building)
         return f"Added {building_type} with {len(workers)} workers"
 
     def process_daily_economy(self, population, weather="normal"):
@@ -99,27 +270,24 @@ class EconomyManager:
             "materials": 0
         }
         
+        output_resources = self.production_system.output_resources
         for building in self.production_buildings:
-            workers = building["workers"]
-            worker_count = len(workers)
-            avg_morale = sum(w.morale for w in workers) / max(1, worker_count)
+            resource = output_resources.get(building.type)
+            if resource is None:
+                continue
             efficiency = self.production_system.calculate_efficiency(
-                avg_morale, 0, weather)
-            if building["type"] == "farm":
-                production = self.production_system.calculate_production(
-                    "farm", worker_count, building["avg_skill"])
-                daily_production["food"] += production * efficiency
-            elif building["type"] == "water_collector":
-                production = self.production_system.calculate_production(
-                    "water_collector", worker_count, building["avg_skill"])
-                daily_production["water"] += production * efficiency
-            elif building["type"] == "scavenging":
-                production = self.production_system.calculate_production(
-                    "scavenging", worker_count, building["avg_skill"])
-                daily_production["materials"] += production * efficiency
+                building.avg_morale, 0, weather)
+            production = self.production_system.calculate_production(
+                building.type, building.worker_count, building.avg_skill)
+            daily_production[resource] += production * efficiency
         
-        sick_count = sum(1 for survivor in population if survivor.health < 70)
-        stress_level = 100 - sum(survivor.morale for survivor in population) / len(population)
+        table = getattr(population[0], "table", None)
+        if table is not None and table.survivors is population:
+            sick_count = table.sick_count(70)
+            stress_level = 100 - table.average_morale()
+        else:
+            sick_count = sum(1 for survivor in population if survivor.health < 70)
+            stress_level = 100 - sum(survivor.morale for survivor in population) / len(population)
         daily_consumption = self.production_system.calculate_consumption(
             population, sick_count, stress_level)
         
@@ -128,12 +296,7 @@ class EconomyManager:
         for resource in daily_consumption:
             self.resources[resource] = max(0, self.resources[resource] - daily_consumption[resource])
         
-        self.daily_history.append({
-            "day": len(self.daily_history) + 1,
-            "production": daily_production,
-            "consumption": daily_consumption,
-            "resources": self.resources.copy()
-        })
+        self.daily_history.append(daily_production, daily_consumption, self.resources)
         
         return {
             "production": daily_production,
@@ -145,25 +308,26 @@ class EconomyManager:
         if not self.daily_history:
             return "No economic data available"
         
+        history = self.daily_history
         avg_production = {
-            "food": sum(d["production"]["food"] for d in self.daily_history[-days:]) / days,
-            "water": sum(d["production"]["water"] for d in self.daily_history[-days:]) / days
+            "food": history.average("production", "food", days),
+            "water": history.average("production", "water", days)
         }
         
         avg_consumption = {
-            "food": sum(d["consumption"]["food"] for d in self.daily_history[-days:]) / days,
-            "water": sum(d["consumption"]["water"] for d in self.daily_history[-days:]) / days
+            "food": history.average("consumption", "food", days),
+            "water": history.average("consumption", "water", days)
         }
         
         report = {
             "summary": {
-                "total_food_produced": sum(d["production"]["food"] for d in self.daily_history[-days:]),
-                "total_water_produced": sum(d["production"]["water"] for d in self.daily_history[-days:]),
+                "total_food_produced": history.total("production", "food", days),
+                "total_water_produced": history.total("production", "water", days),
                 "average_food_consumption": avg_consumption["food"],
                 "average_water_consumption": avg_consumption["water"],
                 "resource_trends": {
-                    "food": self.daily_history[-1]["resources"]["food"] - self.daily_history[-min(days+1, len(self.daily_history))]["resources"]["food"],
-                    "water": self.daily_history[-1]["resources"]["water"] - self.daily_history[-min(days+1, len(self.daily_history))]["resources"]["water"]
+                    "food": history.trend("food", days),
+                    "water": history.trend("water", days)
                 }
             },
             "shortage_prediction": self.production_system.predict_shortage(
@@ -175,16 +339,100 @@ class EconomyManager:
         }
         return report
 
-    def optimize_worker_assignment(self, available_workers):
-        recommendations = []
+    def current_allocation(self):
+        return tuple((b.type, b.worker_count, b.avg_skill, b.avg_morale)
+                     for b in self.production_buildings)
+
+    def project_shortages(self, population, days=30, samples=100, growth_rates=(0.0,),
+                          allocations=None, weathers=("clear", "rain", "storm"), rng=None):
+        rng = rng if rng is not None else random
+        allocations = allocations if allocations is not None else [self.current_allocation()]
+        sick_fraction = sum(1 for s in population if s.health < 70) / max(1, len(population))
+        stress_level = 100 - sum(s.morale for s in population) / max(1, len(population))
+        scenarios = [{
+            "weather": [rng.choice(weathers) for _ in range(days)],
+            "population": len(population),
+            "growth": growth,
+            "allocation": tuple(allocation),
+            "sick_fraction": sick_fraction,
+            "stress_level": stress_level
+        } for allocation in allocations for growth in growth_rates for _ in range(samples)]
+        projection = self.production_system.project_shortages(self.resources, scenarios, days)
+        projection["scenarios"] = len(scenarios)
+        return projection
+
+    def worker_value(self, survivor, role, job=None, weather="normal"):
+        if job is not None:
+            return survivor.skills.get(job.required_skill, 1) * survivor.calculate_productivity()
+        rates = self.production_system.production_rates[role]
+        skill = survivor.skills.get("farming" if role == "farm" else "scouting", 1)
+        efficiency = self.production_system.calculate_efficiency(survivor.morale, 0, weather)
+        return (rates["per_worker"] + rates["skill_multiplier"] * skill) * efficiency
+
+    def optimize_worker_assignment(self, available_workers, jobs=None, capacities=None,
+                                   weights=None, method="flow", weather="normal"):
+        jobs = jobs or {}
+        capacities = capacities or {}
+        job_slots = sum(capacities.get(name, len(job.assigned_survivors)) for name, job in jobs.items())
+        production_workers = max(0, len(available_workers) - job_slots)
         food_priority = max(0, 100 - self.resources["food"]) / 100
         water_priority = max(0, 100 - self.resources["water"]) / 100
         materials_priority = max(0, 50 - self.resources["materials"]) / 50
         total_priority = food_priority + water_priority + materials_priority
         if total_priority == 0:
             total_priority = 1
-        food_workers = int(len(available_workers) * (food_priority / total_priority))
-        water_workers = int(len(available_workers) * (water_priority / total_priority))
-        scavenge_workers = len(available_workers) - food_workers - water_workers
-        recommendations.append(f"Assign {food_workers} to farms, {water_workers} to water collectors, {scavenge_workers} to scavenging")
-        return recommendations
\ No newline at end of file
+        food_workers = int(production_workers * (food_priority / total_priority))
+        water_workers = int(production_workers * (water_priority / total_priority))
+        scavenge_workers = production_workers - food_workers - water_workers
+
+        role_capacities = {"farm": food_workers, "water_collector": water_workers,
+                           "scavenging": scavenge_workers}
+        role_weights = {"farm": 1 + food_priority, "water_collector": 1 + water_priority,
+                        "scavenging": 1 + materials_priority}
+        for name, job in jobs.items():
+            role_capacities[name] = len(job.assigned_survivors)
+            role_weights[name] = 1
+        role_capacities.update(capacities)
+        role_weights.update(weights or {})
+
+        roles = list(role_capacities)
+        values = [[role_weights[role] * self.worker_value(survivor, role, jobs.get(role), weather)
+                   for role in roles] for survivor in available_workers]
+        chosen = AssignmentSolver(method).solve(values, [role_capacities[role] for role in roles])
+
+        assignments = {role: [] for role in roles}
+        total_value = 0
+        for survivor, row, index in zip(available_workers, values, chosen):
+            if index is not None:
+                assignments[roles[index]].append(survivor)
+                total_value += row[index]
+        recommendations = [
+            f"Assign {len(assignments['farm'])} to farms, {len(assignments['water_collector'])} to water collectors, "
+            f"{len(assignments['scavenging'])} to scavenging"]
+        for name in jobs:
+            recommendations.append(f"Assign {len(assignments[name])} to {name}")
+        return {
+            "assignments": assignments,
+            "total_value": total_value,
+            "recommendations": recommendations
+        }
+
+    def apply_worker_assignment(self, assignments, jobs=None):
+        jobs = jobs or {}
+        assigned = [survivor for survivors in assignments.values() for survivor in survivors]
+        for survivor in assigned:
+            for workplace in list(survivor.workplaces):
+                workplace.remove_worker(survivor)
+            if survivor.current_job in jobs:
+                jobs[survivor.current_job].unassign_survivor(survivor)
+        for role, survivors in assignments.items():
+            if role in jobs:
+                for survivor in survivors:
+                    jobs[role].assign_survivor(survivor)
+            elif survivors:
+                building = next((b for b in self.production_buildings if b.type == role), None)
+                if building is None:
+                    self.add_production_building(role)
+                    building = self.production_buildings[-1]
+                for survivor in survivors:
+                    building.add_worker(survivor)
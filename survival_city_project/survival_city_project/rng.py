@@ -0,0 +1,31 @@
+import hashlib
+import random
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else random.randrange(2**63)
+        self.streams = {}
+
+    def derive_seed(self, name):
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def stream(self, name):
+        if name not in self.streams:
+            self.streams[name] = random.Random(self.derive_seed(name))
+        return self.streams[name]
+
+    def spawn(self, index):
+        return RandomStreams(self.derive_seed(f"child:{index}"))
+
+    def draws(self, name, count):
+        draw = self.stream(name).random
+        return [draw() for _ in range(count)]
+
+    def uniforms(self, name, count, low, high):
+        uniform = self.stream(name).uniform
+        return [uniform(low, high) for _ in range(count)]
+
+    def integers(self, name, count, low, high):
+        randint = self.stream(name).randint
+        return [randint(low, high) for _ in range(count)]
@@ -0,0 +1,111 @@
+import argparse
+import json
+import tracemalloc
+from multiprocessing import Pool
+from main import SurvivalGame
+from rng import RandomStreams
+from survivors import Survivor, PopulationManager
+
+def idle_policy(game):
+    pass
+
+def guard_policy(game):
+    jobs = game.population_manager.jobs
+    for survivor in game.population_manager.survivors:
+        if survivor.current_job is None:
+            job = "Guard" if survivor.skills["combat"] >= 3 else "Farmer"
+            jobs[job].assign_survivor(survivor)
+
+POLICIES = {
+    "idle": idle_policy,
+    "guard": guard_policy
+}
+
+def run_game(seed, days, policy="idle"):
+    game = SurvivalGame(seed)
+    apply_policy = POLICIES[policy]
+    events = 0
+    zombies_killed = 0
+    report = {}
+    for _ in range(days):
+        apply_policy(game)
+        report = game.process_day()
+        if report.get("game_over"):
+            break
+        events += len(report["events"])
+        zombies_killed += sum(1 for line in report["combat_results"] if line.endswith("died!"))
+    return {
+        "seed": seed,
+        "policy": policy,
+        "days_played": game.day - 1,
+        "game_over": bool(report.get("game_over")),
+        "reason": report.get("reason"),
+        "population": len(game.population_manager.survivors),
+        "zombies": len(game.zombie_horde.zombies),
+        "zombies_killed": zombies_killed,
+        "events": events,
+        "resources": dict(game.economy_manager.resources)
+    }
+
+def measure_survivor_memory(count=10000, seed=0):
+    streams = RandomStreams(seed)
+    rng = streams.stream("survivors")
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    population = PopulationManager(rng)
+    jobs = list(population.jobs.values())
+    for index in range(count):
+        survivor = Survivor(f"Survivor{index % 100}", rng.randint(18, 60))
+        for skill in survivor.skills:
+            survivor.skills[skill] = max(1, min(10, survivor.skills[skill] + rng.uniform(-0.5, 0.5)))
+        population.add_survivor(survivor)
+        jobs[index % len(jobs)].assign_survivor(survivor)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {"survivors": count, "bytes_per_survivor": used / count}
+
+def child_seeds(root_seed, count):
+    root = RandomStreams(root_seed)
+    return [root.spawn(index).seed for index in range(count)]
+
+def _run_game_task(task):
+    return run_game(*task)
+
+class BatchRunner:
+    def __init__(self, workers=None, chunksize=1):
+        self.workers = workers
+        self.chunksize = chunksize
+
+    def run(self, seeds, days, policies=("idle",)):
+        tasks = [(seed, days, policy) for policy in policies for seed in seeds]
+        if self.workers == 1:
+            for task in tasks:
+                yield _run_game_task(task)
+            return
+        with Pool(self.workers) as pool:
+            for summary in pool.imap_unordered(_run_game_task, tasks, self.chunksize):
+                yield summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Survival City games in parallel")
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=1)
+    parser.add_argument("--survivor-memory", type=int, default=0, metavar="COUNT",
+                        help="report measured memory per survivor for COUNT survivors")
+    args = parser.parse_args()
+
+    if args.survivor_memory:
+        print(json.dumps({"survivor_memory": measure_survivor_memory(args.survivor_memory, args.seed)}),
+              flush=True)
+
+    runner = BatchRunner(args.workers, args.chunksize)
+    seeds = child_seeds(args.seed, args.games)
+    for summary in runner.run(seeds, args.days, args.policy or ["idle"]):
+        print(json.dumps(summary), flush=True)
+
+if __name__ == "__main__":
+    main()
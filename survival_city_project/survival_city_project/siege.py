@@ -0,0 +1,96 @@
+import heapq
+from buildings import Shelter
+
+class FlowField:
+    def __init__(self, targets, building_grid, width=100, height=100):
+        self.width = width
+        self.height = height
+        self.building_grid = building_grid
+        self.distances = {}
+        self.next_cell = {}
+        self.build(targets)
+
+    def cell_of(self, x, y):
+        return (min(self.width - 1, max(0, int(x))), min(self.height - 1, max(0, int(y))))
+
+    def entry_cost(self, cell):
+        building = self.building_grid.get(cell)
+        if building is None or building.current_hp <= 0:
+            return 1
+        return 1 + building.current_hp / 10
+
+    def neighbours(self, cell):
+        x, y = cell
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx or dy) and 0 <= x + dx < self.width and 0 <= y + dy < self.height:
+                    yield (x + dx, y + dy)
+
+    def build(self, targets):
+        distances = self.distances
+        heap = []
+        for target in targets:
+            cell = self.cell_of(*target)
+            distances[cell] = 0
+            heap.append((0, cell))
+        heapq.heapify(heap)
+        while heap:
+            distance, cell = heapq.heappop(heap)
+            if distance > distances[cell]:
+                continue
+            step_distance = distance + self.entry_cost(cell)
+            for neighbour in self.neighbours(cell):
+                if step_distance < distances.get(neighbour, float("inf")):
+                    distances[neighbour] = step_distance
+                    self.next_cell[neighbour] = cell
+                    heapq.heappush(heap, (step_distance, neighbour))
+
+
+class SiegeSystem:
+    def __init__(self, building_manager, width=100, height=100):
+        self.building_manager = building_manager
+        self.width = width
+        self.height = height
+        self.flow_fields = {}
+        self.fields_key = None
+
+    def siege_targets(self):
+        standing = [b for b in self.building_manager.buildings if b.current_hp > 0]
+        shelters = [b.position for b in standing if isinstance(b, Shelter)]
+        return shelters or [b.position for b in standing]
+
+    def get_flow_field(self, targets, day):
+        fields_key = (day, len(self.building_manager.buildings))
+        if fields_key != self.fields_key:
+            self.flow_fields = {}
+            self.fields_key = fields_key
+        target_key = tuple(sorted(tuple(t) for t in targets))
+        if target_key not in self.flow_fields:
+            self.flow_fields[target_key] = FlowField(
+                target_key, self.building_manager.building_grid, self.width, self.height)
+        return self.flow_fields[target_key]
+
+    def advance(self, horde, day, targets=None):
+        targets = targets if targets is not None else self.siege_targets()
+        if not targets:
+            return []
+        field = self.get_flow_field(targets, day)
+        building_grid = self.building_manager.building_grid
+        results = []
+        for slot, state in enumerate(horde.states):
+            if state != "chasing":
+                continue
+            start = field.cell_of(horde.x[slot], horde.y[slot])
+            cell = start
+            for _ in range(int(horde.speed[slot])):
+                next_cell = field.next_cell.get(cell)
+                if next_cell is None:
+                    break
+                building = building_grid.get(next_cell)
+                if building is not None and building.current_hp > 0:
+                    results.append(building.take_damage(horde.damage[slot]))
+                    break
+                cell = next_cell
+            if cell != start:
+                horde.zombies[slot].position = [cell[0] + 0.5, cell[1] + 0.5]
+        return results
@@ -0,0 +1,157 @@
+from array import array
+import math
+
+class SpatialGrid:
+    def __init__(self, locate, cell_size=10, rank=None):
+        self.locate = locate
+        self.rank = rank
+        self.cell_size = cell_size
+        self.cells = {}
+        self.cell_keys = {}
+        self.count = 0
+        self.min_cell = None
+        self.max_cell = None
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, item):
+        return item in self.cells.get(self.cell_of(self.locate(item)), ())
+
+    def cell_of(self, position):
+        return (int(position[0] // self.cell_size), int(position[1] // self.cell_size))
+
+    def insert(self, item):
+        self.place(item, self.cell_of(self.locate(item)))
+        self.count += 1
+
+    def new_bucket(self):
+        return {}
+
+    def bucket(self, cell):
+        bucket = self.cells.get(cell)
+        if bucket is not None:
+            return bucket
+        cell = self.cell_keys.setdefault(cell, cell)
+        bucket = self.cells[cell] = self.new_bucket()
+        if self.min_cell is None:
+            self.min_cell = cell
+            self.max_cell = cell
+        else:
+            self.min_cell = (min(self.min_cell[0], cell[0]), min(self.min_cell[1], cell[1]))
+            self.max_cell = (max(self.max_cell[0], cell[0]), max(self.max_cell[1], cell[1]))
+        return bucket
+
+    def place(self, item, cell):
+        self.bucket(cell)[item] = None
+
+    def discard(self, item, cell):
+        bucket = self.cells[cell]
+        del bucket[item]
+        if not bucket:
+            del self.cells[cell]
+
+    def remove(self, item):
+        self.discard(item, self.cell_of(self.locate(item)))
+        self.count -= 1
+
+    def move(self, item, old_position):
+        old_cell = self.cell_of(old_position)
+        new_cell = self.cell_of(self.locate(item))
+        if new_cell != old_cell:
+            self.discard(item, old_cell)
+            self.place(item, new_cell)
+
+    def ring(self, center, radius):
+        cx, cy = center
+        if radius == 0:
+            return [center]
+        cells = []
+        for dx in range(-radius, radius + 1):
+            cells.append((cx + dx, cy - radius))
+            cells.append((cx + dx, cy + radius))
+        for dy in range(-radius + 1, radius):
+            cells.append((cx - radius, cy + dy))
+            cells.append((cx + radius, cy + dy))
+        return cells
+
+    def cells_around(self, position, radius):
+        low = self.cell_of((position[0] - radius, position[1] - radius))
+        high = self.cell_of((position[0] + radius, position[1] + radius))
+        return [(cx, cy) for cx in range(low[0], high[0] + 1) for cy in range(low[1], high[1] + 1)]
+
+    def within(self, position, radius):
+        found = []
+        for cell in self.cells_around(position, radius):
+            for item in self.cells.get(cell, ()):
+                distance = math.dist(position, self.locate(item))
+                if distance <= radius:
+                    found.append((item, distance))
+        if self.rank is not None:
+            found.sort(key=lambda entry: self.rank(entry[0]))
+        return found
+
+    def nearest(self, position, max_distance=None):
+        if not self.count:
+            return None, None
+        center = self.cell_of(position)
+        max_ring = max(abs(center[0] - self.min_cell[0]), abs(self.max_cell[0] - center[0]),
+                       abs(center[1] - self.min_cell[1]), abs(self.max_cell[1] - center[1]))
+        best, best_distance = None, None
+        for radius in range(max_ring + 1):
+            for cell in self.ring(center, radius):
+                for item in self.cells.get(cell, ()):
+                    distance = math.dist(position, self.locate(item))
+                    if max_distance is not None and distance > max_distance:
+                        continue
+                    if (best is None or distance < best_distance or
+                            (distance == best_distance and self.rank is not None
+                             and self.rank(item) < self.rank(best))):
+                        best, best_distance = item, distance
+            reach = radius * self.cell_size
+            if best is not None and best_distance < reach:
+                break
+            if max_distance is not None and max_distance < reach:
+                break
+        return best, best_distance
+
+
+class SlotGrid(SpatialGrid):
+    def __init__(self, locate, cell_size=10, rank=None):
+        super().__init__(locate, cell_size, rank)
+        self.where = array("q")
+
+    def __contains__(self, slot):
+        if not 0 <= slot < len(self.where):
+            return False
+        bucket = self.cells.get(self.cell_of(self.locate(slot)), ())
+        position = self.where[slot]
+        return position < len(bucket) and bucket[position] == slot
+
+    def new_bucket(self):
+        return array("q")
+
+    def place(self, slot, cell):
+        bucket = self.bucket(cell)
+        if slot >= len(self.where):
+            self.where.frombytes(bytes(self.where.itemsize * (slot + 1 - len(self.where))))
+        self.where[slot] = len(bucket)
+        bucket.append(slot)
+
+    def discard(self, slot, cell):
+        bucket = self.cells[cell]
+        position = self.where[slot]
+        last = bucket.pop()
+        if last != slot:
+            bucket[position] = last
+            self.where[last] = position
+        if not bucket:
+            del self.cells[cell]
+
+    def relabel(self, old_slot, new_slot):
+        position = self.where[old_slot]
+        self.cells[self.cell_of(self.locate(old_slot))][position] = new_slot
+        self.where[new_slot] = position
+
+    def truncate(self, count):
+        del self.where[count:]
@@ -1,22 +1,136 @@
+import itertools
+import math
+import operator
 import random
+from array import array
+from bisect import bisect_left, bisect_right
+
+SKILLS = ("combat", "medical", "farming", "building", "scouting")
+_survivor_ids = itertools.count()
+JOB_NAMES = [None]
+JOB_IDS = {None: 0}
+
+def intern_job(name):
+    if name not in JOB_IDS:
+        JOB_IDS[name] = len(JOB_NAMES)
+        JOB_NAMES.append(name)
+    return JOB_IDS[name]
+
+def _column(name):
+    def getter(self):
+        return getattr(self.table, name)[self.row]
+
+    def setter(self, value):
+        getattr(self.table, name)[self.row] = value
+
+    return property(getter, setter)
+
+class SurvivorSkills:
+    __slots__ = ("survivor",)
+
+    def __init__(self, survivor):
+        self.survivor = survivor
+
+    def __getitem__(self, skill):
+        return self.survivor.table.skills[skill][self.survivor.row]
+
+    def __setitem__(self, skill, value):
+        self.survivor.table.set_skill(self.survivor.row, skill, value)
+
+    def __contains__(self, skill):
+        return skill in self.survivor.table.skills
+
+    def __iter__(self):
+        return iter(SKILLS)
+
+    def __len__(self):
+        return len(SKILLS)
+
+    def __eq__(self, other):
+        return dict(self.items()) == dict(other)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, skill, default=None):
+        column = self.survivor.table.skills.get(skill)
+        return column[self.survivor.row] if column is not None else default
+
+    def keys(self):
+        return list(SKILLS)
+
+    def values(self):
+        return [self[skill] for skill in SKILLS]
+
+    def items(self):
+        return [(skill, self[skill]) for skill in SKILLS]
+
+    def copy(self):
+        return dict(self.items())
 
 class Survivor:
-    def __init__(self, name, age):
-        self.name = name
-        self.age = age
-        self.health = 100
-        self.hunger = 0
-        self.thirst = 0
-        self.morale = 75
-        self.skills = {
-            "combat": 1,
-            "medical": 1,
-            "farming": 1,
-            "building": 1,
-            "scouting": 1
-        }
-        self.current_job = None
-        self.job_experience = {}
+    __slots__ = ("table", "row")
+    id = _column("ids")
+    name = _column("names")
+    age = _column("ages")
+    health = _column("health")
+    hunger = _column("hunger")
+    thirst = _column("thirst")
+
+    @property
+    def current_job(self):
+        return JOB_NAMES[self.table.current_jobs[self.row]]
+
+    @current_job.setter
+    def current_job(self, value):
+        self.table.current_jobs[self.row] = intern_job(value)
+
+    @property
+    def job_experience(self):
+        experience = self.table.experience
+        return {skill: experience[skill][self.row] for skill in SKILLS if experience[skill][self.row]}
+
+    @job_experience.setter
+    def job_experience(self, value):
+        for skill in SKILLS:
+            self.table.experience[skill][self.row] = value.get(skill, 0)
+
+    @property
+    def workplaces(self):
+        return self.table.workplaces[self.row] or ()
+
+    def add_workplace(self, workplace):
+        workplaces = self.table.workplaces
+        workplaces[self.row] = (workplaces[self.row] or ()) + (workplace,)
+
+    def remove_workplace(self, workplace):
+        workplaces = list(self.workplaces)
+        workplaces.remove(workplace)
+        self.table.workplaces[self.row] = tuple(workplaces) or None
+
+    def __init__(self, name, age, table=None):
+        self.table = table if table is not None else SurvivorTable()
+        self.table.add_survivor(self, name, age)
+
+    @property
+    def morale(self):
+        return self.table.morale[self.row]
+
+    @morale.setter
+    def morale(self, value):
+        old_morale = self.table.morale[self.row]
+        self.table.morale[self.row] = value
+        for workplace in self.workplaces:
+            workplace.morale_changed(old_morale, value)
+
+    @property
+    def skills(self):
+        return SurvivorSkills(self)
+
+    @skills.setter
+    def skills(self, value):
+        for skill in SKILLS:
+            self.table.set_skill(self.row, skill, value.get(skill, 1))
 
     def update_needs(self):
         self.hunger = min(100, self.hunger + 10)
@@ -34,10 +148,12 @@ class Survivor:
 
     def gain_experience(self, skill, amount):
         if skill in self.skills:
-            self.skills[skill] += amount
-            self.job_experience[skill] = self.job_experience.get(skill, 0) + amount
-            if self.skills[skill] > 10:
-                self.skills[skill] = 10
+            old_level = self.table.skills[skill][self.row]
+            new_level = old_level + amount
+            if new_level > 10:
+                new_level = 10
+            self.table.set_skill(self.row, skill, new_level)
+            self.table.experience[skill][self.row] += amount
 
     def calculate_productivity(self):
         health_factor = self.health / 100
@@ -46,69 +162,480 @@ class Survivor:
         return (health_factor * 0.4 + morale_factor * 0.4 + needs_factor * 0.2)
 
 
+class SkillIndex:
+    def __init__(self):
+        self.levels = {skill: array("d") for skill in SKILLS}
+        self.ids = {skill: array("q") for skill in SKILLS}
+        self.stale = set()
+        self.pending = {skill: {} for skill in SKILLS}
+
+    def position(self, skill, level, survivor_id):
+        levels = self.levels[skill]
+        low = bisect_left(levels, level)
+        high = bisect_right(levels, level, low)
+        return bisect_left(self.ids[skill], survivor_id, low, high)
+
+    def insert(self, skill, level, survivor_id):
+        if survivor_id in self.stale:
+            self.purge()
+        position = self.position(skill, level, survivor_id)
+        self.levels[skill].insert(position, level)
+        self.ids[skill].insert(position, survivor_id)
+
+    def remove(self, skill, level, survivor_id):
+        position = self.position(skill, level, survivor_id)
+        del self.levels[skill][position]
+        del self.ids[skill][position]
+
+    def insert_many(self, levels, survivor_ids):
+        if not self.stale.isdisjoint(survivor_ids):
+            self.purge()
+        for skill in SKILLS:
+            self.merge(skill, zip(levels[skill], survivor_ids))
+
+    def merge(self, skill, pairs):
+        pairs = sorted(itertools.chain(zip(self.levels[skill], self.ids[skill]), pairs))
+        self.levels[skill] = array("d", [level for level, _ in pairs])
+        self.ids[skill] = array("q", [survivor_id for _, survivor_id in pairs])
+
+    def discard(self, survivor_id):
+        self.stale.add(survivor_id)
+        if len(self.stale) > max(64, len(self.ids[SKILLS[0]]) // 8):
+            self.purge()
+
+    def purge(self):
+        if self.stale:
+            self.remove_many(set())
+        for skill, changes in self.pending.items():
+            if changes:
+                self.pending[skill] = {}
+                self.refresh(skill, changes)
+
+    def refresh(self, skill, changes):
+        if len(changes) <= 64:
+            for survivor_id, (indexed_level, level) in changes.items():
+                if indexed_level != level:
+                    self.remove(skill, indexed_level, survivor_id)
+                    self.insert(skill, level, survivor_id)
+            return
+        levels, ids = self.levels[skill], self.ids[skill]
+        keep = bytes(map(operator.not_, map(changes.__contains__, ids)))
+        self.levels[skill] = array("d", itertools.compress(levels, keep))
+        self.ids[skill] = array("q", itertools.compress(ids, keep))
+        self.merge(skill, [(level, survivor_id) for survivor_id, (_, level) in changes.items()])
+
+    def remove_many(self, survivor_ids):
+        survivor_ids = survivor_ids | self.stale
+        self.stale = set()
+        for skill in SKILLS:
+            changes = self.pending[skill]
+            for survivor_id in survivor_ids.intersection(changes):
+                del changes[survivor_id]
+            levels, ids = self.levels[skill], self.ids[skill]
+            keep = bytes(map(operator.not_, map(survivor_ids.__contains__, ids)))
+            self.levels[skill] = array("d", itertools.compress(levels, keep))
+            self.ids[skill] = array("q", itertools.compress(ids, keep))
+
+    def update(self, skill, old_level, new_level, survivor_id):
+        if old_level != new_level:
+            changes = self.pending[skill]
+            indexed_level = changes[survivor_id][0] if survivor_id in changes else old_level
+            changes[survivor_id] = (indexed_level, new_level)
+
+    def at_least(self, skill, min_level):
+        if skill not in self.levels:
+            return []
+        self.purge()
+        start = bisect_left(self.levels[skill], min_level)
+        return self.ids[skill][start:][::-1]
+
+    def top(self, skill, count):
+        if skill not in self.levels or count <= 0:
+            return []
+        self.purge()
+        return self.ids[skill][-count:][::-1]
+
+    def between(self, skill, low, high):
+        if skill not in self.levels:
+            return []
+        self.purge()
+        levels = self.levels[skill]
+        start = bisect_left(levels, low)
+        return self.ids[skill][start:bisect_right(levels, high, start)][::-1]
+
+class SurvivorTable:
+    def __init__(self, indexed=False):
+        self.survivors = []
+        self.registry = {}
+        self.ids = array("q")
+        self.names = []
+        self.ages = []
+        self.health = []
+        self.hunger = []
+        self.thirst = []
+        self.morale = []
+        self.current_jobs = array("H")
+        self.workplaces = []
+        self.skills = {skill: array("d") for skill in SKILLS}
+        self.experience = {skill: array("d") for skill in SKILLS}
+        self.skill_index = SkillIndex() if indexed else None
+
+    def __len__(self):
+        return len(self.survivors)
+
+    def columns(self):
+        return (self.survivors, self.ids, self.names, self.ages, self.health, self.hunger, self.thirst,
+                self.morale, self.current_jobs, self.workplaces,
+                *self.skills.values(), *self.experience.values())
+
+    def add_survivor(self, survivor, name, age):
+        survivor_id = next(_survivor_ids)
+        self.survivors.append(survivor)
+        self.registry[survivor_id] = survivor
+        self.ids.append(survivor_id)
+        self.names.append(name)
+        self.ages.append(age)
+        self.health.append(100)
+        self.hunger.append(0)
+        self.thirst.append(0)
+        self.morale.append(75)
+        self.current_jobs.append(0)
+        self.workplaces.append(None)
+        for column in self.skills.values():
+            column.append(1)
+        for column in self.experience.values():
+            column.append(0)
+        survivor.row = len(self.survivors) - 1
+        self.index_row(survivor.row)
+        return survivor.row
+
+    def append_survivors(self, names, ages, skills=None):
+        start = len(self.survivors)
+        count = len(names)
+        survivor_ids = list(itertools.islice(_survivor_ids, count))
+        survivors = []
+        for row in range(start, start + count):
+            survivor = Survivor.__new__(Survivor)
+            survivor.table = self
+            survivor.row = row
+            survivors.append(survivor)
+        self.survivors.extend(survivors)
+        self.registry.update(zip(survivor_ids, survivors))
+        self.ids.extend(survivor_ids)
+        self.names.extend(names)
+        self.ages.extend(ages)
+        self.health.extend([100] * count)
+        self.hunger.extend([0] * count)
+        self.thirst.extend([0] * count)
+        self.morale.extend([75] * count)
+        self.current_jobs.extend([0] * count)
+        self.workplaces.extend([None] * count)
+        for skill, column in self.skills.items():
+            column.extend(skills[skill] if skills and skill in skills else [1] * count)
+        for column in self.experience.values():
+            column.extend([0] * count)
+        self.index_rows(range(start, start + count))
+        return survivors
+
+    def adopt_many(self, survivors):
+        sources = {}
+        for survivor in dict.fromkeys(survivors):
+            if survivor.table is not self:
+                sources.setdefault(survivor.table, []).append(survivor)
+        start = len(self.survivors)
+        columns = self.columns()[1:]
+        for source, adopted in sources.items():
+            rows = [survivor.row for survivor in adopted]
+            for column, source_column in zip(columns, source.columns()[1:]):
+                column.extend([source_column[row] for row in rows])
+            self.registry.update(zip([source.ids[row] for row in rows], adopted))
+            for row, survivor in enumerate(adopted, len(self.survivors)):
+                survivor.table = self
+                survivor.row = row
+            self.survivors.extend(adopted)
+            source.remove_rows(rows)
+        self.index_rows(range(start, len(self.survivors)))
+
+    def copy_row(self, survivor, source, row):
+        self.survivors.append(survivor)
+        for column, source_column in zip(self.columns()[1:], source.columns()[1:]):
+            column.append(source_column[row])
+        self.registry[source.ids[row]] = survivor
+        survivor.table = self
+        survivor.row = len(self.survivors) - 1
+        self.index_row(survivor.row)
+
+    def index_rows(self, rows):
+        if self.skill_index is None or not rows:
+            return
+        if len(rows) <= 64:
+            for row in rows:
+                self.index_row(row)
+            return
+        self.skill_index.insert_many({skill: [column[row] for row in rows] for skill, column in self.skills.items()},
+                                     [self.ids[row] for row in rows])
+
+    def index_row(self, row):
+        if self.skill_index is not None:
+            for skill, column in self.skills.items():
+                self.skill_index.insert(skill, column[row], self.ids[row])
+
+    def set_skill(self, row, skill, level):
+        column = self.skills[skill]
+        old_level = column[row]
+        if self.skill_index is not None:
+            self.skill_index.update(skill, old_level, level, self.ids[row])
+        column[row] = level
+        for workplace in self.workplaces[row] or ():
+            workplace.skill_changed(skill, old_level, level)
+
+    def adopt(self, survivor):
+        source, row = survivor.table, survivor.row
+        self.copy_row(survivor, source, row)
+        source.remove_rows([row])
+
+    def detach_rows(self, rows):
+        rows = [row for row in rows if self.survivors[row].table is self]
+        if not rows:
+            return
+        detached = SurvivorTable()
+        for column, source in zip(detached.columns(), self.columns()):
+            column.extend([source[row] for row in rows])
+        for row, survivor in enumerate(detached.survivors):
+            survivor.table = detached
+            survivor.row = row
+        detached.registry = dict(zip(detached.ids, detached.survivors))
+
+    def unindex_rows(self, rows):
+        if self.skill_index is None:
+            return
+        if len(rows) > 64:
+            self.skill_index.remove_many({self.ids[row] for row in rows})
+            return
+        for row in rows:
+            self.skill_index.discard(self.ids[row])
+
+    def remove_rows(self, rows):
+        rows = sorted(set(rows), reverse=True)
+        self.detach_rows(rows)
+        self.unindex_rows(rows)
+        columns = self.columns()
+        for row in rows:
+            del self.registry[self.ids[row]]
+            last = len(self.survivors) - 1
+            if row != last:
+                for column in columns:
+                    column[row] = column[last]
+                self.survivors[row].row = row
+            for column in columns:
+                column.pop()
+
+    def compact_rows(self, rows):
+        removed = set(rows)
+        if not removed:
+            return
+        rows = sorted(removed)
+        self.detach_rows(rows)
+        self.unindex_rows(rows)
+        for row in rows:
+            del self.registry[self.ids[row]]
+        keep = bytearray(b"\x01") * len(self.survivors)
+        for row in rows:
+            keep[row] = 0
+        for column in self.columns():
+            kept = itertools.compress(column, keep)
+            column[:] = array(column.typecode, kept) if isinstance(column, array) else list(kept)
+        for row, survivor in enumerate(self.survivors):
+            survivor.row = row
+
+    def update_needs(self):
+        self.hunger[:] = [hunger + 10 if hunger < 90 else 100 for hunger in self.hunger]
+        self.thirst[:] = [thirst + 15 if thirst < 85 else 100 for thirst in self.thirst]
+        self.health[:] = [0 if hunger >= 100 or thirst >= 100 else health
+                          for health, hunger, thirst in zip(self.health, self.hunger, self.thirst)]
+        return [row for row, health in enumerate(self.health) if health <= 0]
+
+    def productivity(self, rows=None):
+        rows = rows if rows is not None else range(len(self.survivors))
+        health, morale, hunger, thirst = self.health, self.morale, self.hunger, self.thirst
+        return [health[row] / 100 * 0.4 + morale[row] / 100 * 0.4 +
+                (1 - ((hunger[row] + thirst[row]) / 200)) * 0.2 for row in rows]
+
+    def sick_count(self, threshold=70):
+        return sum(1 for health in self.health if health < threshold)
+
+    def average_morale(self):
+        return sum(self.morale) / max(1, len(self.morale))
+
+    def total_consumption(self):
+        return {
+            "food": sum(2 + (hunger / 50) for hunger in self.hunger),
+            "water": sum(1.5 + (thirst / 75) for thirst in self.thirst)
+        }
+
+
 class Job:
-    def __init__(self, name, required_skill, danger_level):
+    def __init__(self, name, required_skill, danger_level, rng=None, jobs=None):
         self.name = name
         self.required_skill = required_skill
         self.danger_level = danger_level
-        self.assigned_survivors = []
+        self.assigned_survivors = {}
+        self.rng = rng if rng is not None else random
+        self.jobs = jobs
 
     def assign_survivor(self, survivor):
         if survivor not in self.assigned_survivors:
-            self.assigned_survivors.append(survivor)
+            old_job = self.jobs.get(survivor.current_job) if self.jobs else None
+            if old_job is not None:
+                old_job.unassign_survivor(survivor)
+            self.assigned_survivors[survivor] = None
             survivor.current_job = self.name
 
+    def unassign_survivor(self, survivor):
+        if survivor in self.assigned_survivors:
+            del self.assigned_survivors[survivor]
+            survivor.current_job = None
+
     def calculate_output(self):
-        total_output = 0
-        for survivor in self.assigned_survivors:
-            skill_level = survivor.skills.get(self.required_skill, 1)
-            productivity = survivor.calculate_productivity()
-            total_output += skill_level * productivity
-        return total_output
+        roster = list(self.assigned_survivors)
+        if not roster:
+            return 0
+        table = roster[0].table
+        if any(survivor.table is not table for survivor in roster):
+            return sum(survivor.skills.get(self.required_skill, 1) * survivor.calculate_productivity()
+                       for survivor in roster)
+        rows = [survivor.row for survivor in roster]
+        skills = table.skills.get(self.required_skill)
+        levels = [skills[row] for row in rows] if skills is not None else [1] * len(rows)
+        return sum(level * productivity for level, productivity in zip(levels, table.productivity(rows)))
+
+    def danger_hits(self, count):
+        chance = self.danger_level / 100
+        if chance <= 0:
+            return []
+        if chance >= 1:
+            return list(range(count))
+        log_miss = math.log(1 - chance)
+        random_draw = self.rng.random
+        hits = []
+        index = int(math.log(1 - random_draw()) / log_miss)
+        while index < count:
+            hits.append(index)
+            index += 1 + int(math.log(1 - random_draw()) / log_miss)
+        return hits
 
     def process_danger(self):
-        for survivor in self.assigned_survivors:
-            if random.random() < (self.danger_level / 100):
-                damage = random.randint(1, self.danger_level)
-                survivor.health = max(0, survivor.health - damage)
-                if random.random() < 0.3:
-                    survivor.gain_experience(self.required_skill, 0.5)
+        roster = list(self.assigned_survivors)
+        for index in self.danger_hits(len(roster)):
+            survivor = roster[index]
+            damage = self.rng.randint(1, self.danger_level)
+            survivor.health = max(0, survivor.health - damage)
+            if self.rng.random() < 0.3:
+                survivor.gain_experience(self.required_skill, 0.5)
 
 
 class PopulationManager:
-    def __init__(self):
-        self.survivors = []
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.table = SurvivorTable(indexed=True)
+        self.survivors = self.table.survivors
         self.jobs = {
-    "Guard": Job("Guard", "combat", 7),
-    "Farmer": Job("Farmer", "farming", 2),
-    "Medic": Job("Medic", "medical", 3),
-    "Builder": Job("Builder", "building", 4),
-    "Scout": Job("Scout", "scouting", 8)
+    "Guard": Job("Guard", "combat", 7, self.rng),
+    "Farmer": Job("Farmer", "farming", 2, self.rng),
+    "Medic": Job("Medic", "medical", 3, self.rng),
+    "Builder": Job("Builder", "building", 4, self.rng),
+    "Scout": Job("Scout", "scouting", 8, self.rng)
 }
+        for job in self.jobs.values():
+            job.jobs = self.jobs
 
     def add_survivor(self, survivor):
-        self.survivors.append(survivor)
+        if survivor.table is not self.table:
+            self.table.adopt(survivor)
+
+    def add_survivors(self, survivors):
+        self.table.adopt_many(survivors)
+
+    def create_survivors(self, names, ages, skills=None):
+        return self.table.append_survivors(names, ages, skills)
+
+    def get_survivor(self, survivor_id):
+        return self.table.registry.get(survivor_id)
+
+    def release_survivor(self, survivor):
+        if survivor.current_job in self.jobs:
+            self.jobs[survivor.current_job].assigned_survivors.pop(survivor, None)
+        for workplace in survivor.workplaces:
+            workplace.remove_worker(survivor)
+        survivor.current_job = None
+
+    def remove_survivor(self, survivor):
+        self.release_survivor(survivor)
+        if survivor.table is self.table:
+            self.table.remove_rows([survivor.row])
 
     def daily_update(self):
-        dead_survivors = []
-        for survivor in self.survivors:
-            survivor.update_needs()
-            if survivor.health <= 0:
-                dead_survivors.append(survivor)
-                if survivor.current_job and survivor in self.jobs[survivor.current_job].assigned_survivors:
-                    self.jobs[survivor.current_job].assigned_survivors.remove(survivor)
-        for dead in dead_survivors:
-            self.survivors.remove(dead)
+        dead_rows = self.table.update_needs()
+        for row in dead_rows:
+            self.release_survivor(self.survivors[row])
+        if dead_rows:
+            self.table.compact_rows(dead_rows)
         for job in self.jobs.values():
             job.process_danger()
 
+    def fast_forward(self, days):
+        table = self.table
+        death_days = [1 if health <= 0 else
+                      max(1, min(math.ceil((100 - hunger) / 10), math.ceil((100 - thirst) / 15)))
+                      for health, hunger, thirst in zip(table.health, table.hunger, table.thirst)]
+        for job in self.jobs.values():
+            roster = list(job.assigned_survivors)
+            offsets = [0]
+            for survivor in roster:
+                limit = min(days, death_days[survivor.row] - 1) if survivor.table is table else days
+                offsets.append(offsets[-1] + max(0, limit))
+            position = 0
+            for hit in job.danger_hits(offsets[-1]):
+                while hit >= offsets[position + 1]:
+                    position += 1
+                survivor = roster[position]
+                day = hit - offsets[position] + 1
+                member = survivor.table is table
+                if member and day >= death_days[survivor.row]:
+                    continue
+                damage = job.rng.randint(1, job.danger_level)
+                survivor.health = max(0, survivor.health - damage)
+                if job.rng.random() < 0.3:
+                    survivor.gain_experience(job.required_skill, 0.5)
+                if member and survivor.health <= 0:
+                    death_days[survivor.row] = day + 1
+
+        updates = [min(days, death_day) for death_day in death_days]
+        table.hunger[:] = [min(100, hunger + 10 * count) for hunger, count in zip(table.hunger, updates)]
+        table.thirst[:] = [min(100, thirst + 15 * count) for thirst, count in zip(table.thirst, updates)]
+        table.health[:] = [0 if hunger >= 100 or thirst >= 100 else health
+                           for health, hunger, thirst in zip(table.health, table.hunger, table.thirst)]
+        dead_rows = [row for row, death_day in enumerate(death_days) if death_day <= days]
+        for row in dead_rows:
+            self.release_survivor(self.survivors[row])
+        if dead_rows:
+            table.compact_rows(dead_rows)
+        return {"days": days, "deaths": len(dead_rows), "survivors": len(self.survivors)}
+
     def get_specialists(self, skill, min_level=3):
-        return [s for s in self.survivors if s.skills.get(skill, 0) >= min_level]
+        registry = self.table.registry
+        return [registry[survivor_id] for survivor_id in self.table.skill_index.at_least(skill, min_level)]
+
+    def top_specialists(self, skill, count=5):
+        registry = self.table.registry
+        return [registry[survivor_id] for survivor_id in self.table.skill_index.top(skill, count)]
+
+    def get_skill_range(self, skill, low, high):
+        registry = self.table.registry
+        return [registry[survivor_id] for survivor_id in self.table.skill_index.between(skill, low, high)]
+
+    def calculate_job_outputs(self):
+        return {name: job.calculate_output() for name, job in self.jobs.items()}
 
     def calculate_total_consumption(self):
-        total_food = 0
-        total_water = 0
-        for survivor in self.survivors:
-            total_food += 2 + (survivor.hunger / 50)
-            total_water += 1.5 + (survivor.thirst / 75)
-        return {"food": total_food, "water": total_water}
\ No newline at end of file
+        return self.table.total_consumption()
\ No newline at end of file
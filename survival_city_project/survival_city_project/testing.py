@@ -1,6 +1,12 @@
+import itertools
+import math
 import unittest
 import random
-from survivor_system import Survivor, PopulationManager
+from survivors import Survivor, PopulationManager, Job
+from zombies import ZombieHorde
+from combat import CombatSystem
+from assignment import AssignmentSolver
+from resources import ProductionBuilding
 
 class GameBalanceTester:
     def __init__(self):
@@ -111,6 +117,33 @@ class GameBalanceTester:
         self.balance_metrics["combat_balance"] = 1 - (combat_score / 1.6)
         return results
 
+    def test_auto_resolve_accuracy(self, survivor_count=2000, zombie_count=2000, combat_skill=5,
+                                   test_runs=3, seed=0):
+        weapons = ["fists", "knife", "melee_weapon"]
+        results = {"full_kills": 0, "auto_kills": 0, "full_wounds": 0, "auto_wounds": 0}
+        for run in range(test_runs):
+            for mode, threshold in (("full", None), ("auto", 0)):
+                rng = random.Random(seed + run)
+                horde = ZombieHorde(random.Random(seed + run))
+                horde.spawn_zombies([rng.choice(["shambler", "runner", "screamer"])
+                                     for _ in range(zombie_count)])
+                survivors = [{
+                    "name": f"Fighter{i}",
+                    "combat_skill": combat_skill,
+                    "weapon": rng.choice(weapons),
+                    "position": [rng.randint(0, 100), rng.randint(0, 100)]
+                } for i in range(survivor_count)]
+                combat = CombatSystem(random.Random(seed + run + 1), auto_resolve_threshold=threshold)
+                report = combat.group_combat(survivors, horde.zombies)
+                results[f"{mode}_kills"] += sum(1 for line in report if line.endswith("died!")) / test_runs
+                results[f"{mode}_wounds"] += sum(
+                    max_health - health for max_health, health in zip(horde.max_health, horde.health)) / test_runs
+        results["kill_ratio"] = results["auto_kills"] / results["full_kills"] if results["full_kills"] else 1
+        results["wound_ratio"] = results["auto_wounds"] / results["full_wounds"] if results["full_wounds"] else 1
+        error = max(abs(1 - results["kill_ratio"]), abs(1 - results["wound_ratio"]))
+        self.balance_metrics["auto_resolve_accuracy"] = 1 - error
+        return results
+
 
 class GameValidator:
     def __init__(self):
@@ -148,6 +181,217 @@ class GameValidator:
         if len(buildings) > 20:
             self.warnings.append("Large number of buildings may impact performance")
 
+    def validate_assignment_solver(self, cases=400, seed=0):
+        rng = random.Random(seed)
+        solver = AssignmentSolver("flow")
+        for case in range(cases):
+            workers, roles = rng.randint(1, 6), rng.randint(1, 3)
+            values = [[rng.choice([0, rng.uniform(-5, 10)]) for _ in range(roles)] for _ in range(workers)]
+            capacities = [rng.randint(0, 3) for _ in range(roles)]
+            assignment = solver.solve(values, capacities)
+            loads = [assignment.count(role) for role in range(roles)]
+            if any(load > capacity for load, capacity in zip(loads, capacities)):
+                self.errors.append(f"Assignment case {case} exceeds role capacity: {loads} > {capacities}")
+                continue
+            total = sum(values[worker][role] for worker, role in enumerate(assignment) if role is not None)
+            best = max(
+                sum(values[worker][role] for worker, role in enumerate(choice) if role is not None)
+                for choice in itertools.product([None] + list(range(roles)), repeat=workers)
+                if all(choice.count(role) <= capacities[role] for role in range(roles))
+            )
+            if abs(total - best) > 1e-9:
+                self.errors.append(f"Assignment case {case} scored {total:.6f}, brute force found {best:.6f}")
+        return not self.errors
+
+    def validate_population_removal(self, count=2000, removals=300, seed=0):
+        rng = random.Random(seed)
+        population = PopulationManager(rng)
+        survivors = [Survivor(f"Test{i}", rng.randint(18, 60)) for i in range(count)]
+        population.add_survivors(survivors)
+        jobs = list(population.jobs.values())
+        farm = ProductionBuilding("farm", survivors[::3])
+        for index, survivor in enumerate(survivors):
+            survivor.skills["combat"] = rng.randint(1, 10)
+            jobs[index % len(jobs)].assign_survivor(survivor)
+        removed = rng.sample(survivors, removals)
+        for survivor in removed:
+            population.remove_survivor(survivor)
+        for survivor in rng.sample(population.survivors, removals):
+            survivor.thirst = 100
+        order = [survivor for survivor in population.survivors if survivor.thirst < 100]
+        population.daily_update()
+        removed = set(survivors) - set(population.survivors)
+        if population.survivors != order:
+            self.errors.append("Daily deaths changed the order of the surviving population")
+        if any(survivor.row != row or survivor.table is not population.table
+               for row, survivor in enumerate(population.survivors)):
+            self.errors.append("Survivor views point at the wrong table rows")
+        if dict(population.table.registry) != {survivor.id: survivor for survivor in population.survivors}:
+            self.errors.append("Survivor registry does not match the population")
+        if any(survivor.current_job is not None or survivor.workplaces for survivor in removed):
+            self.errors.append("Removed survivors still hold a job or workplace")
+        if any(survivor in job.assigned_survivors for job in jobs for survivor in removed):
+            self.errors.append("Removed survivors are still on a job roster")
+        alive_workers = [survivor for survivor in survivors[::3] if survivor not in removed]
+        if list(farm.workers) != alive_workers or farm.worker_count != len(alive_workers):
+            self.errors.append("Farm roster does not match its living workers")
+        for level in (1, 5, 10):
+            expected = {survivor for survivor in population.survivors if survivor.skills["combat"] >= level}
+            if set(population.get_specialists("combat", level)) != expected:
+                self.errors.append(f"Skill index disagrees with a full scan at combat >= {level}")
+        return not self.errors
+
+    def validate_combat_volley(self, volleys=200, seed=0):
+        rng = random.Random(seed)
+        weapons = ["fists", "knife", "pistol", "rifle", "melee_weapon", "slingshot"]
+        for volley in range(volleys):
+            combat_seed = rng.random()
+            engagements = [({"combat_skill": rng.randint(1, 10)}, rng.randrange(5), rng.choice(weapons),
+                            rng.uniform(0, 10)) for _ in range(rng.randint(1, 12))]
+            outcomes = []
+            for batched in (True, False):
+                combat = CombatSystem(random.Random(combat_seed))
+                horde = ZombieHorde(random.Random(seed))
+                targets = [horde.spawn_zombie("shambler") for _ in range(5)]
+                batch = [(attacker, targets[target], weapon, distance)
+                         for attacker, target, weapon, distance in engagements]
+                if batched:
+                    result = combat.resolve_volley(batch)
+                    result = list(zip(result["hit"], result["damage"], result["critical"]))
+                else:
+                    result = [combat.resolve_attack(*engagement) for engagement in batch]
+                    result = [(single["hit"], single["damage"], single["critical"]) for single in result]
+                outcomes.append((result, [target.health for target in targets]))
+            if outcomes[0] != outcomes[1]:
+                self.errors.append(f"Volley {volley} differs from sequential resolve_attack calls")
+        return not self.errors
+
+    def validate_group_combat_targets(self, fights=20, seed=0):
+        rng = random.Random(seed)
+        weapons = ["fists", "knife", "pistol", "rifle", "melee_weapon"]
+        for fight in range(fights):
+            horde_seed, combat_seed = rng.random(), rng.random()
+            zombie_types = [rng.choice(["shambler", "runner", "screamer"]) for _ in range(rng.randint(1, 300))]
+            survivors = [{"name": f"Test{i}", "combat_skill": rng.randint(1, 10), "weapon": rng.choice(weapons),
+                          "position": [rng.randint(0, 100), rng.randint(0, 100)]}
+                         for i in range(rng.randint(1, 100))]
+            horde = ZombieHorde(random.Random(horde_seed))
+            horde.spawn_zombies(zombie_types)
+            healths = [rng.randint(1, 60) for _ in zombie_types]
+            for zombie, health in zip(horde.zombies, healths):
+                zombie.health = health
+            results = CombatSystem(random.Random(combat_seed)).group_combat(survivors, horde.zombies)
+
+            reference_horde = ZombieHorde(random.Random(horde_seed))
+            reference_horde.spawn_zombies(zombie_types)
+            for zombie, health in zip(reference_horde.zombies, healths):
+                zombie.health = health
+            combat = CombatSystem(random.Random(combat_seed))
+            alive = list(reference_horde.zombies)
+            expected = []
+            for survivor in survivors:
+                if not alive:
+                    break
+                weapon_range = combat.weapon_stats[survivor["weapon"]]["range"]
+                in_range = [(math.dist(survivor["position"], zombie.position), zombie.serial, zombie)
+                            for zombie in alive]
+                in_range = [entry for entry in in_range if entry[0] <= weapon_range]
+                if not in_range:
+                    continue
+                distance, _, target = min(in_range, key=lambda entry: entry[:2])
+                attack = combat.resolve_attack(survivor, target, survivor["weapon"], distance)
+                expected.append(f"{survivor['name']} attacked {target.zombie_type} - Hit: {attack['hit']}, "
+                                f"Damage: {attack['damage']}, Critical: {attack['critical']}")
+                if target.health <= 0:
+                    alive.remove(target)
+                    expected.append(f"{target.zombie_type} died!")
+            if results != expected:
+                self.errors.append(f"Grid targeting in fight {fight} differs from a brute-force nearest scan")
+        return not self.errors
+
+    def fast_forward_population(self, seed, count, max_needs=95):
+        rng = random.Random(seed)
+        population = PopulationManager(random.Random(seed))
+        population.add_survivors([Survivor(f"Test{i}", rng.randint(18, 60)) for i in range(count)])
+        jobs = list(population.jobs.values())
+        for survivor in population.survivors:
+            survivor.hunger = rng.randint(0, max_needs)
+            survivor.thirst = rng.randint(0, max_needs)
+            survivor.health = rng.randint(1, 100)
+            if rng.random() < 0.8:
+                rng.choice(jobs).assign_survivor(survivor)
+        return population
+
+    def population_state(self, population):
+        table = population.table
+        return (list(table.names), list(table.health), list(table.hunger), list(table.thirst),
+                {skill: list(column) for skill, column in table.skills.items()},
+                {name: [survivor.name for survivor in job.assigned_survivors] for name, job in population.jobs.items()})
+
+    def validate_fast_forward(self, seeds=50, count=200, days=5, runs=40):
+        for seed in range(seeds):
+            stepped = self.fast_forward_population(seed, count)
+            stepped.daily_update()
+            skipped = self.fast_forward_population(seed, count)
+            skipped.fast_forward(1)
+            if self.population_state(stepped) != self.population_state(skipped):
+                self.errors.append(f"One-day fast_forward differs from daily_update for seed {seed}")
+        damage = {"daily_update": 0, "fast_forward": 0}
+        for run in range(runs):
+            for mode in damage:
+                population = self.fast_forward_population(seeds + run, count, max_needs=20)
+                before = sum(population.table.health)
+                if mode == "fast_forward":
+                    population.fast_forward(days)
+                else:
+                    for _ in range(days):
+                        population.daily_update()
+                damage[mode] += before - sum(population.table.health)
+        stepped, skipped = damage["daily_update"], damage["fast_forward"]
+        if abs(stepped - skipped) > 0.1 * max(stepped, skipped):
+            self.errors.append(f"{days}-day fast_forward dealt {skipped} job damage, daily_update dealt {stepped}")
+        return not self.errors
+
+    def validate_horde_update(self, cases=20, seed=0):
+        rng = random.Random(seed)
+        for case in range(cases):
+            horde_seed = rng.random()
+            zombie_types = [rng.choice(["shambler", "runner", "screamer"]) for _ in range(rng.randint(1, 400))]
+            humans = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(rng.randint(0, 20))]
+            horde = ZombieHorde(random.Random(horde_seed))
+            horde.spawn_zombies(zombie_types)
+            expected = []
+            for x, y, speed in zip(horde.x, horde.y, horde.speed):
+                state = "wandering"
+                for human_x, human_y in humans:
+                    distance = math.sqrt((human_x - x) ** 2 + (human_y - y) ** 2)
+                    if distance <= 30:
+                        state = "chasing"
+                        if distance > 0:
+                            x += (human_x - x) / distance * speed
+                            y += (human_y - y) / distance * speed
+                expected.append((x, y, state))
+            for _ in range(2):
+                horde.update_all(humans)
+                actual = list(zip(horde.x, horde.y, horde.states))
+                if actual != expected:
+                    self.errors.append(f"update_all case {case} differs from a per-zombie scan")
+                    break
+                expected = []
+                for x, y, state, speed in zip(horde.x, horde.y, horde.states, horde.speed):
+                    for human_x, human_y in humans:
+                        distance = math.sqrt((human_x - x) ** 2 + (human_y - y) ** 2)
+                        if distance <= 30:
+                            state = "chasing"
+                            if distance > 0:
+                                x += (human_x - x) / distance * speed
+                                y += (human_y - y) / distance * speed
+                    expected.append((x, y, state))
+            if any(horde.grid.cell_of(horde.slot_position(slot)) != cell
+                   for cell, bucket in horde.grid.cells.items() for slot in bucket):
+                self.errors.append(f"update_all case {case} left zombies in the wrong grid cells")
+        return not self.errors
+
     def generate_validation_report(self):
         return {
             "errors": self.errors,
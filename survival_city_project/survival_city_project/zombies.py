@@ -1,64 +1,333 @@
 import math
 import random
+import weakref
+from array import array
+from collections import deque
+from spatial import SlotGrid
+
+def _column(name):
+    def getter(self):
+        return getattr(self.horde, name)[self.slot]
+
+    def setter(self, value):
+        getattr(self.horde, name)[self.slot] = value
+
+    return property(getter, setter)
+
+class ZombiePosition:
+    __slots__ = ("zombie",)
+
+    def __init__(self, zombie):
+        self.zombie = zombie
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return (self.zombie.horde.x, self.zombie.horde.y)[index][self.zombie.slot]
+
+    def __setitem__(self, index, value):
+        position = list(self)
+        position[index] = value
+        self.zombie.position = position
+
+    def __iter__(self):
+        yield self[0]
+        yield self[1]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+class ZombieSequence:
+    __slots__ = ("horde",)
+
+    def __init__(self, horde):
+        self.horde = horde
+
+    def __len__(self):
+        return len(self.horde.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.horde.view(slot) for slot in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("zombie index out of range")
+        return self.horde.view(index)
+
+    def __iter__(self):
+        view = self.horde.view
+        return (view(slot) for slot in range(len(self)))
 
 class BaseZombie:
-    def __init__(self, zombie_type, health, speed, damage):
-        self.zombie_type = zombie_type
-        self.health = health
-        self.max_health = health
-        self.speed = speed
-        self.damage = damage
-        self.position = [random.randint(0, 100), random.randint(0, 100)]
-        self.state = "wandering"
+    __slots__ = ("horde", "slot", "__weakref__")
+    zombie_type = _column("types")
+    health = _column("health")
+    max_health = _column("max_health")
+    speed = _column("speed")
+    damage = _column("damage")
+    state = _column("states")
+    serial = _column("serials")
+
+    def __init__(self, zombie_type, health, speed, damage, horde=None):
+        self.horde = horde if horde is not None else ZombieHorde()
+        position = [self.horde.rng.randint(0, 100), self.horde.rng.randint(0, 100)]
+        self.horde.add_zombie(self, zombie_type, health, speed, damage, position)
+
+    @property
+    def position(self):
+        return ZombiePosition(self)
+
+    @position.setter
+    def position(self, value):
+        old_position = self.horde.locate(self)
+        self.horde.x[self.slot] = value[0]
+        self.horde.y[self.slot] = value[1]
+        if self.horde.grid is not None:
+            self.horde.grid.move(self.slot, old_position)
 
     def move_towards(self, target_position):
-        direction = [target_position[0] - self.position[0], target_position[1] - self.position[1]]
-        distance = math.sqrt(direction[0]**2 + direction[1]**2)
-        if distance > 0:
-            self.position[0] += (direction[0] / distance) * self.speed
-            self.position[1] += (direction[1] / distance) * self.speed
+        self.horde.move_towards(self.slot, target_position)
 
     def take_damage(self, amount):
         self.health -= amount
         return f"{self.zombie_type} {'died' if self.health <= 0 else f'has {self.health} health left'}."
 
     def can_detect_human(self, human_position, max_range):
-        distance = math.sqrt((human_position[0] - self.position[0])**2 + 
-                           (human_position[1] - self.position[1])**2)
+        distance = math.sqrt((human_position[0] - self.horde.x[self.slot])**2 +
+                           (human_position[1] - self.horde.y[self.slot])**2)
         return distance <= max_range
 
 class Shambler(BaseZombie):
-    def __init__(self):
-        super().__init__("shambler", health=100, speed=1, damage=10)
+    __slots__ = ()
+    zombie_stats = {"zombie_type": "shambler", "health": 100, "speed": 1, "damage": 10}
+
+    def __init__(self, horde=None):
+        super().__init__(**self.zombie_stats, horde=horde)
 
 class Runner(BaseZombie):
-    def __init__(self):
-        super().__init__("runner", health=70, speed=4, damage=15)
+    __slots__ = ()
+    zombie_stats = {"zombie_type": "runner", "health": 70, "speed": 4, "damage": 15}
+
+    def __init__(self, horde=None):
+        super().__init__(**self.zombie_stats, horde=horde)
 
     def lunge_attack(self, target_position):
         self.move_towards(target_position)
         self.speed += 2
 
 class Screamer(BaseZombie):
-    def __init__(self):
-        super().__init__("screamer", health=50, speed=2, damage=5)
+    __slots__ = ()
+    zombie_stats = {"zombie_type": "screamer", "health": 50, "speed": 2, "damage": 5}
+
+    def __init__(self, horde=None):
+        super().__init__(**self.zombie_stats, horde=horde)
 
-    def alert_nearby(self, horde):
-        for zombie in horde.zombies:
-            if zombie != self and self.can_detect_human(zombie.position, 15):
-                zombie.state = "chasing"
+    def alert_nearby(self, horde, radius=15):
+        for slot, _ in horde.grid.within(self.horde.locate(self), radius):
+            if horde is not self.horde or slot != self.slot:
+                horde.states[slot] = "chasing"
 
 class ZombieHorde:
-    def __init__(self):
-        self.zombies = []
+    def __init__(self, rng=None, indexed=True):
+        self.rng = rng if rng is not None else random
+        self.zombies = ZombieSequence(self)
+        self.views = weakref.WeakValueDictionary()
+        self.types = []
+        self.health = []
+        self.max_health = []
+        self.speed = []
+        self.damage = []
+        self.states = []
+        self.x = array("d")
+        self.y = array("d")
+        self.serials = array("q")
+        self.spawned = 0
+        self.graveyard = None
+        self.grid = SlotGrid(self.slot_position, cell_size=15) if indexed else None
+
+    def columns(self):
+        return (self.types, self.health, self.max_health, self.speed,
+                self.damage, self.states, self.x, self.y, self.serials)
+
+    def locate(self, zombie):
+        return (self.x[zombie.slot], self.y[zombie.slot])
+
+    def slot_position(self, slot):
+        return (self.x[slot], self.y[slot])
+
+    def view(self, slot):
+        zombie = self.views.get(slot)
+        if zombie is None:
+            zombie_class = ZOMBIE_CLASSES[self.types[slot]]
+            zombie = zombie_class.__new__(zombie_class)
+            zombie.horde = self
+            zombie.slot = slot
+            self.views[slot] = zombie
+        return zombie
+
+    def add_zombie(self, zombie, zombie_type, health, speed, damage, position):
+        self.types.append(zombie_type)
+        self.health.append(health)
+        self.max_health.append(health)
+        self.speed.append(speed)
+        self.damage.append(damage)
+        self.states.append("wandering")
+        self.x.append(position[0])
+        self.y.append(position[1])
+        self.serials.append(self.spawned)
+        self.spawned += 1
+        zombie.slot = len(self.types) - 1
+        self.views[zombie.slot] = zombie
+        if self.grid is not None:
+            self.grid.insert(zombie.slot)
+        return zombie.slot
+
+    def remove_zombie(self, zombie):
+        self.remove_zombies([zombie])
+
+    def remove_zombies(self, zombies):
+        zombies = list(dict.fromkeys(zombie for zombie in zombies if zombie.horde is self))
+        if not zombies:
+            return
+        graveyard = self.dig_graveyard()
+        start = len(graveyard.types)
+        slots = [zombie.slot for zombie in zombies]
+        for column, source in zip(graveyard.columns(), self.columns()):
+            column.extend(map(source.__getitem__, slots))
+        columns = self.columns()
+        grid = self.grid
+        for zombie in zombies:
+            slot = zombie.slot
+            self.views.pop(slot, None)
+            last = len(self.types) - 1
+            if grid is not None:
+                grid.remove(slot)
+                if slot != last:
+                    grid.relabel(last, slot)
+            if slot != last:
+                for column in columns:
+                    column[slot] = column[last]
+                moved = self.views.pop(last, None)
+                if moved is not None:
+                    moved.slot = slot
+                    self.views[slot] = moved
+            for column in columns:
+                column.pop()
+        if grid is not None:
+            grid.truncate(len(self.types))
+        for slot, zombie in enumerate(zombies, start):
+            zombie.horde = graveyard
+            zombie.slot = slot
+            graveyard.views[slot] = zombie
+
+    def dig_graveyard(self):
+        if self.graveyard is None:
+            self.graveyard = ZombieHorde(self.rng, indexed=False)
+        elif len(self.graveyard.types) > 2 * len(self.graveyard.views) + 1024:
+            self.graveyard.keep_viewed_rows()
+        return self.graveyard
+
+    def keep_viewed_rows(self):
+        viewed = sorted(self.views.items())
+        slots = [slot for slot, _ in viewed]
+        for column in self.columns():
+            kept = [column[slot] for slot in slots]
+            column[:] = array(column.typecode, kept) if isinstance(column, array) else kept
+        self.views = weakref.WeakValueDictionary()
+        if self.grid is not None:
+            self.grid = SlotGrid(self.slot_position, cell_size=15)
+        for slot, (_, zombie) in enumerate(viewed):
+            zombie.slot = slot
+            self.views[slot] = zombie
+            if self.grid is not None:
+                self.grid.insert(slot)
 
     def spawn_zombie(self, zombie_type):
-        zombie_classes = {"shambler": Shambler, "runner": Runner, "screamer": Screamer}
-        self.zombies.append(zombie_classes[zombie_type]())
-
-    def update_all(self, human_positions):
-        for zombie in self.zombies:
-            for human_pos in human_positions:
-                if zombie.can_detect_human(human_pos, 30):
-                    zombie.state = "chasing"
-                    zombie.move_towards(human_pos)
\ No newline at end of file
+        return ZOMBIE_CLASSES[zombie_type](self)
+
+    def spawn_zombies(self, zombie_types):
+        stats = [ZOMBIE_CLASSES[zombie_type].zombie_stats for zombie_type in zombie_types]
+        randint = self.rng.randint
+        positions = [(randint(0, 100), randint(0, 100)) for _ in stats]
+        start = len(self.types)
+        self.types.extend(s["zombie_type"] for s in stats)
+        self.health.extend(s["health"] for s in stats)
+        self.max_health.extend(s["health"] for s in stats)
+        self.speed.extend(s["speed"] for s in stats)
+        self.damage.extend(s["damage"] for s in stats)
+        self.states.extend("wandering" for _ in stats)
+        self.x.extend(position[0] for position in positions)
+        self.y.extend(position[1] for position in positions)
+        self.serials.extend(range(self.spawned, self.spawned + len(stats)))
+        self.spawned += len(stats)
+        if self.grid is not None:
+            for slot in range(start, len(self.types)):
+                self.grid.insert(slot)
+        return range(start, len(self.types))
+
+    def move_towards(self, slot, target_position):
+        direction = [target_position[0] - self.x[slot], target_position[1] - self.y[slot]]
+        distance = math.sqrt(direction[0]**2 + direction[1]**2)
+        if distance > 0:
+            old_position = (self.x[slot], self.y[slot])
+            self.x[slot] += (direction[0] / distance) * self.speed[slot]
+            self.y[slot] += (direction[1] / distance) * self.speed[slot]
+            if self.grid is not None:
+                self.grid.move(slot, old_position)
+
+    def update_all(self, human_positions, max_range=30, move=True):
+        xs, ys, speeds, states = self.x, self.y, self.speed, self.states
+        grid = self.grid
+        cells, cells_around, discard, place = grid.cells, grid.cells_around, grid.discard, grid.place
+        cell_size = grid.cell_size
+        sqrt = math.sqrt
+        for human_pos in human_positions:
+            hx, hy = human_pos[0], human_pos[1]
+            nearby = [slot for cell in cells_around(human_pos, max_range)
+                      if cell in cells for slot in cells[cell]]
+            for slot in nearby:
+                dx = hx - xs[slot]
+                dy = hy - ys[slot]
+                distance = sqrt(dx**2 + dy**2)
+                if distance <= max_range:
+                    states[slot] = "chasing"
+                    if move and distance > 0:
+                        x, y = xs[slot], ys[slot]
+                        xs[slot] = new_x = x + (dx / distance) * speeds[slot]
+                        ys[slot] = new_y = y + (dy / distance) * speeds[slot]
+                        old_cell = (int(x // cell_size), int(y // cell_size))
+                        new_cell = (int(new_x // cell_size), int(new_y // cell_size))
+                        if new_cell != old_cell:
+                            discard(slot, old_cell)
+                            place(slot, new_cell)
+
+    def alert_screamers(self, radius=15, wave=False):
+        screamers = [self.view(slot) for slot, zombie_type in enumerate(self.types)
+                     if zombie_type == "screamer"]
+        if wave:
+            self.alert_wave(screamers, radius)
+        else:
+            for screamer in screamers:
+                screamer.alert_nearby(self, radius)
+
+    def alert_wave(self, sources, radius=15):
+        sources = [zombie.slot for zombie in sources]
+        relayed = set(sources)
+        queue = deque(sources)
+        while queue:
+            slot = queue.popleft()
+            for neighbour, _ in self.grid.within(self.slot_position(slot), radius):
+                if neighbour == slot:
+                    continue
+                self.states[neighbour] = "chasing"
+                if neighbour not in relayed:
+                    relayed.add(neighbour)
+                    queue.append(neighbour)
+        return len(relayed) - len(sources)
+
+ZOMBIE_CLASSES = {"shambler": Shambler, "runner": Runner, "screamer": Screamer}